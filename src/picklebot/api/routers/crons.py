@@ -30,7 +30,7 @@ def _write_cron_file(cron_id: str, data: CronCreate, crons_path) -> None:  # typ
 @router.get("", response_model=list[CronDef])
 def list_crons(ctx: SharedContext = Depends(get_context)) -> list[CronDef]:
     """List all crons."""
-    return ctx.cron_loader.discover_crons()
+    return list(ctx.cron_loader.discover_crons())
 
 
 @router.get("/{cron_id}", response_model=CronDef)
@@ -69,6 +69,8 @@ def update_cron(
         raise HTTPException(status_code=404, detail=f"Cron not found: {cron_id}")
 
     _write_cron_file(cron_id, data, crons_path)
+    # A same-size rewrite within one mtime tick would look unchanged
+    ctx.cron_loader.invalidate(cron_id)
     return ctx.cron_loader.load(cron_id)
 
 
@@ -82,3 +84,4 @@ def delete_cron(cron_id: str, ctx: SharedContext = Depends(get_context)) -> None
         raise HTTPException(status_code=404, detail=f"Cron not found: {cron_id}")
 
     shutil.rmtree(cron_dir)
+    ctx.cron_loader.invalidate(cron_id)
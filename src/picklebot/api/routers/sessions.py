@@ -53,20 +53,5 @@ def get_session(session_id: str, ctx: SharedContext = Depends(get_context)) -> d
 @router.delete("/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_session(session_id: str, ctx: SharedContext = Depends(get_context)) -> None:
     """Delete a session."""
-    # Get the session file
-    session_file = ctx.history_store._session_path(session_id)
-
-    # Check if session exists in index
-    sessions = ctx.history_store._read_index()
-    session = next((s for s in sessions if s.id == session_id), None)
-
-    if not session:
+    if not ctx.history_store.delete_session(session_id):
         raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
-
-    # Remove session file if it exists
-    if session_file.exists():
-        session_file.unlink()
-
-    # Remove from index
-    sessions = [s for s in sessions if s.id != session_id]
-    ctx.history_store._write_index(sessions)
@@ -68,6 +68,8 @@ def update_skill(
         raise HTTPException(status_code=404, detail=f"Skill not found: {skill_id}")
 
     _write_skill_file(skill_id, data, skills_path)
+    # A same-size rewrite within one mtime tick would look unchanged
+    ctx.skill_loader.invalidate(skill_id)
     return ctx.skill_loader.load_skill(skill_id)
 
 
@@ -81,3 +83,4 @@ def delete_skill(skill_id: str, ctx: SharedContext = Depends(get_context)) -> No
         raise HTTPException(status_code=404, detail=f"Skill not found: {skill_id}")
 
     shutil.rmtree(skill_dir)
+    ctx.skill_loader.invalidate(skill_id)
@@ -48,6 +48,8 @@ class DiscordChannel(Channel[DiscordEventSource]):
             config: Discord configuration
         """
         self.config = config
+        # Set form of the whitelist for O(1) checks on every inbound message
+        self._allowed_user_ids = frozenset(config.allowed_user_ids)
         self.client: discord.Client | None = None
         self._running_task: asyncio.Task | None = None
 
@@ -115,9 +117,9 @@ class DiscordChannel(Channel[DiscordEventSource]):
 
     def is_allowed(self, source: DiscordEventSource) -> bool:
         """Check if sender is whitelisted."""
-        if not self.config.allowed_user_ids:
+        if not self._allowed_user_ids:
             return True
-        return source.user_id in self.config.allowed_user_ids
+        return source.user_id in self._allowed_user_ids
 
     async def reply(self, content: str, source: DiscordEventSource) -> None:
         """Reply to incoming message in the same channel."""
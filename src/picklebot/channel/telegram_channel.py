@@ -49,15 +49,17 @@ class TelegramChannel(Channel[TelegramEventSource]):
             config: Telegram configuration
         """
         self.config = config
+        # Set form of the whitelist for O(1) checks on every inbound message
+        self._allowed_user_ids = frozenset(config.allowed_user_ids)
         self.application: Application | None = None
         self._running_task: asyncio.Task | None = None
         self._stop_event: asyncio.Event | None = None
 
     def is_allowed(self, source: TelegramEventSource) -> bool:
         """Check if sender is whitelisted."""
-        if not self.config.allowed_user_ids:
+        if not self._allowed_user_ids:
             return True
-        return source.user_id in self.config.allowed_user_ids
+        return source.user_id in self._allowed_user_ids
 
     async def run(
         self, on_message: Callable[[str, TelegramEventSource], Awaitable[None]]
@@ -1,6 +1,7 @@
 import uuid
 import json
 import asyncio
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING
@@ -222,41 +223,49 @@ class AgentSession:
         Returns:
             Assistant's response text
         """
-        user_msg: Message = {"role": "user", "content": message}
-        self.state.add_message(user_msg)
-
-        tool_schemas = self.tools.get_tool_schemas()
-
-        while True:
-            messages = self.state.build_messages()
-            self.state = await self.context_guard.check_and_compact(self.state)
-            content, tool_calls = await self.agent.llm.chat(messages, tool_schemas)
-
-            tool_call_dicts: list[ChatCompletionMessageToolCallParam] = [
-                {
-                    "id": tc.id,
-                    "type": "function",
-                    "function": {"name": tc.name, "arguments": tc.arguments},
+        history_store = self.shared_context.history_store
+        # Hold the session file for the turn; pending messages land on exit.
+        # Compaction may roll to a new session mid-turn, which is held too.
+        with ExitStack() as held_sessions:
+            held_sessions.enter_context(history_store.session(self.session_id))
+            user_msg: Message = {"role": "user", "content": message}
+            self.state.add_message(user_msg)
+
+            tool_schemas = self.tools.get_tool_schemas()
+
+            while True:
+                messages = self.state.build_messages()
+                session_id = self.session_id
+                self.state = await self.context_guard.check_and_compact(self.state)
+                if self.session_id != session_id:
+                    held_sessions.enter_context(history_store.session(self.session_id))
+                content, tool_calls = await self.agent.llm.chat(messages, tool_schemas)
+
+                tool_call_dicts: list[ChatCompletionMessageToolCallParam] = [
+                    {
+                        "id": tc.id,
+                        "type": "function",
+                        "function": {"name": tc.name, "arguments": tc.arguments},
+                    }
+                    for tc in tool_calls
+                ]
+                assistant_msg: Message = {
+                    "role": "assistant",
+                    "content": content,
                 }
-                for tc in tool_calls
-            ]
-            assistant_msg: Message = {
-                "role": "assistant",
-                "content": content,
-            }
-            if tool_call_dicts:
-                assistant_msg["tool_calls"] = tool_call_dicts
+                if tool_call_dicts:
+                    assistant_msg["tool_calls"] = tool_call_dicts
 
-            self.state.add_message(assistant_msg)
+                self.state.add_message(assistant_msg)
 
-            if not tool_calls:
-                break
+                if not tool_calls:
+                    break
 
-            await self._handle_tool_calls(tool_calls)
+                await self._handle_tool_calls(tool_calls)
 
-            continue
+                continue
 
-        return content
+            return content
 
     async def _handle_tool_calls(
         self,
@@ -272,13 +281,15 @@ class AgentSession:
             *[self._execute_tool_call(tool_call) for tool_call in tool_calls]
         )
 
-        for tool_call, result in zip(tool_calls, tool_call_results):
-            tool_msg: Message = {
+        tool_msgs: list[Message] = [
+            {
                 "role": "tool",
                 "content": result,
                 "tool_call_id": tool_call.id,
             }
-            self.state.add_message(tool_msg)
+            for tool_call, result in zip(tool_calls, tool_call_results)
+        ]
+        self.state.add_messages(tool_msgs)
 
     async def _execute_tool_call(
         self,
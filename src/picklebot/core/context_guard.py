@@ -178,8 +178,7 @@ class ContextGuard:
         )
 
         compacted_history = await self._build_compacted_messages(state)
-        for message in compacted_history:
-            new_session.state.add_message(message)
+        new_session.state.add_messages(compacted_history)
 
         return new_session.state
 
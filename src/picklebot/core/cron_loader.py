@@ -1,18 +1,30 @@
 """Cron job definition loader."""
 
 import logging
+import threading
+from collections.abc import Collection
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from datetime import datetime
 
 from croniter import croniter
-from pydantic import BaseModel, ValidationError, field_validator
+from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
+from watchdog.events import (
+    EVENT_TYPE_CLOSED_NO_WRITE,
+    EVENT_TYPE_OPENED,
+    FileSystemEvent,
+    FileSystemEventHandler,
+)
+from watchdog.observers import Observer
 
 from picklebot.utils.def_loader import (
+    DEFAULT_IGNORED_NAMES,
+    DefCache,
     DefNotFoundError,
     InvalidDefError,
     discover_definitions,
     get_template_variables,
-    parse_definition,
+    read_definition,
     substitute_template,
 )
 
@@ -25,6 +37,9 @@ logger = logging.getLogger(__name__)
 class CronDef(BaseModel):
     """Loaded cron job definition."""
 
+    # Immutable so CronLoader can hand the same discovery snapshot to every caller
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     description: str
@@ -57,6 +72,22 @@ class CronDef(BaseModel):
         return v
 
 
+class CronHandler(FileSystemEventHandler):
+    """Invalidates CronLoader caches when files under the crons directory change."""
+
+    def __init__(self, loader: "CronLoader"):
+        self._loader = loader
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        """Drop cached state for the cron folder(s) the event touched."""
+        # Reads (including our own) report open/close events; only writes matter
+        if event.event_type in (EVENT_TYPE_OPENED, EVENT_TYPE_CLOSED_NO_WRITE):
+            return
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if path:
+                self._loader._on_path_changed(str(path))
+
+
 class CronLoader:
     """Loads cron job definitions from CRON.md files."""
 
@@ -65,21 +96,124 @@ class CronLoader:
         """Create CronLoader from config."""
         return CronLoader(config)
 
-    def __init__(self, config: "Config"):
+    def __init__(
+        self,
+        config: "Config",
+        ignored_names: Collection[str] = (),
+    ):
         """
         Initialize CronLoader.
 
         Args:
             config: Config object containing crons_path, workspace, etc.
+            ignored_names: Extra folder names in crons_path that are never
+                crons (DEFAULT_IGNORED_NAMES and dot-folders are always skipped)
         """
         self.config = config
+        self.ignored_names = DEFAULT_IGNORED_NAMES.union(ignored_names)
         self.config.crons_path.mkdir(parents=True, exist_ok=True)
+        # Directory the cache and watcher belong to; a config reload may move it
+        self._crons_path = self.config.crons_path
+        self._cache = DefCache()
+        # While watching, the last discovery result is reused until a
+        # filesystem event bumps the generation. The watcher thread drops the
+        # snapshot, so the snapshot fields are only touched under the lock.
+        self._observer: Any = None
+        self._snapshot_lock = threading.Lock()
+        self._generation = 0
+        self._discovered: tuple[CronDef, ...] | None = None
+        # Template variables the snapshot's prompts were substituted with
+        self._discovered_variables: dict[str, str] | None = None
 
-    def discover_crons(self) -> list[CronDef]:
+    def discover_crons(self) -> tuple[CronDef, ...]:
         """Scan crons directory, return definitions for all valid jobs."""
-        return discover_definitions(
-            self.config.crons_path, "CRON.md", self._parse_cron_def
+        self._follow_crons_path()
+        # The result is immutable, so a watched snapshot can be returned as-is
+        # unless a config reload changed the paths substituted into prompts
+        variables = get_template_variables(self.config)
+        with self._snapshot_lock:
+            if self._discovered is not None and self._discovered_variables == variables:
+                return self._discovered
+            generation = self._generation
+
+        crons = tuple(
+            discover_definitions(
+                self.config.crons_path,
+                "CRON.md",
+                self._parse_cron_def,
+                self._cache,
+                self.ignored_names,
+            )
         )
+        # Only keep the snapshot if nothing changed while scanning
+        with self._snapshot_lock:
+            if self._observer is not None and generation == self._generation:
+                self._discovered = crons
+                self._discovered_variables = variables
+        return crons
+
+    def invalidate(self, cron_id: str | None = None) -> None:
+        """Drop cached definitions for one cron, or all crons if no ID given."""
+        self._drop_snapshot()
+        if cron_id is None:
+            self._cache.invalidate()
+        else:
+            self._cache.invalidate(self.config.crons_path / cron_id / "CRON.md")
+
+    def _drop_snapshot(self) -> None:
+        """Forget the discovery snapshot, including any scan still in flight."""
+        with self._snapshot_lock:
+            self._generation += 1
+            self._discovered = None
+
+    def start_watching(self) -> None:
+        """Watch the crons directory so discovery can skip unchanged scans."""
+        if self._observer is not None:
+            return
+
+        self._observer = Observer()
+        self._observer.schedule(
+            CronHandler(self), str(self._crons_path), recursive=True
+        )
+        self._observer.start()
+
+    def stop_watching(self) -> None:
+        """Stop watching and go back to scanning on every discovery."""
+        if self._observer is None:
+            return
+
+        self._observer.stop()
+        self._observer.join()
+        self._observer = None
+        self._drop_snapshot()
+
+    def _follow_crons_path(self) -> None:
+        """Re-watch the new directory if a config reload moved crons_path."""
+        crons_path = self.config.crons_path
+        if crons_path == self._crons_path:
+            return
+
+        watching = self._observer is not None
+        self.stop_watching()
+        crons_path.mkdir(parents=True, exist_ok=True)
+        self._crons_path = crons_path
+        if watching:
+            self.start_watching()
+
+    def _on_path_changed(self, path: str) -> None:
+        """Invalidate the cron folder containing path (called from watcher thread)."""
+        try:
+            relative = Path(path).relative_to(self._crons_path)
+        except ValueError:
+            return
+
+        if relative.parts:
+            cron_id = relative.parts[0]
+            if cron_id.startswith(".") or cron_id in self.ignored_names:
+                return
+            self.invalidate(cron_id)
+        else:
+            self._drop_snapshot()
 
     def _parse_cron_def(
         self, def_id: str, frontmatter: dict[str, Any], body: str
@@ -104,13 +238,15 @@ class CronLoader:
 
     def load(self, cron_id: str) -> CronDef:
         """Load cron by ID."""
+        self._follow_crons_path()
         cron_file = self.config.crons_path / cron_id / "CRON.md"
         if not cron_file.exists():
             raise DefNotFoundError("cron", cron_id)
 
         try:
-            content = cron_file.read_text()
-            cron_def = parse_definition(content, cron_id, self._parse_cron_def)
+            cron_def = read_definition(
+                cron_file, cron_id, self._parse_cron_def, self._cache
+            )
         except InvalidDefError:
             raise
         except Exception as e:
@@ -55,7 +55,8 @@ class EventBus(Worker):
 
     async def publish(self, event: Event) -> None:
         """Publish an event to the internal queue (non-blocking)."""
-        await self._queue.put(event)
+        # Unbounded queue: put_nowait never blocks, skip the put() coroutine
+        self._queue.put_nowait(event)
         logger.debug(f"Queued {event.__class__.__name__} event from {event.source}")
 
     async def run(self) -> None:
@@ -1,27 +1,109 @@
 """JSONL file-based conversation history backend."""
 
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Literal, TYPE_CHECKING
+from typing import Any, BinaryIO, Literal, TYPE_CHECKING
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from picklebot.core.events import EventSource
 from litellm.types.completion import ChatCompletionMessageParam as Message
 
-
 if TYPE_CHECKING:
     from picklebot.utils.config import Config
 
+# Session files kept open for appending; least recently used beyond this closes
+MAX_OPEN_SESSION_FILES = 32
+# Sessions whose parsed messages get_messages keeps for incremental reads
+MAX_CACHED_SESSIONS = 32
+# Write buffer per open session file; messages are flushed when it fills
+SESSION_WRITE_BUFFER = 1 << 16
+# index.jsonl is rewritten once it exceeds 2x the live sessions plus this many lines
+INDEX_COMPACT_SLACK = 64
+# Auto-generated titles are cut to this many characters, then "..." is appended
+TITLE_MAX_CHARS = 50
+
 
 def _now_iso() -> str:
     """Return current datetime as ISO format string."""
     return datetime.now().isoformat()
 
 
+def _make_title(content: str) -> str:
+    """Session title from a message: its first TITLE_MAX_CHARS characters."""
+    if len(content) <= TITLE_MAX_CHARS:
+        return content
+    return content[:TITLE_MAX_CHARS] + "..."
+
+
+class _LineAppender:
+    """Append-only file that hands the kernel whole lines only.
+
+    Writes are collected in memory and passed to an unbuffered O_APPEND file
+    in one write() per flush, so lines from concurrent writers to the same
+    file never interleave mid-line. Methods may be called from several
+    threads (the event loop writes while API worker threads sync).
+    """
+
+    def __init__(self, path: str):
+        # Held open across calls and closed by close(), not a with block
+        self._file = open(path, "ab", buffering=0)  # noqa: SIM115
+        self._pending = bytearray()
+        self._lock = threading.Lock()
+
+    def write(self, lines: bytes) -> None:
+        """Queue complete newline-terminated lines, flushing once buffer fills."""
+        with self._lock:
+            self._pending += lines
+            if len(self._pending) >= SESSION_WRITE_BUFFER:
+                self._flush()
+
+    def flush(self) -> None:
+        """Write all queued lines to the file."""
+        with self._lock:
+            self._flush()
+
+    def close(self) -> None:
+        """Flush queued lines and close the file."""
+        with self._lock:
+            try:
+                self._flush()
+            finally:
+                self._file.close()
+
+    def _flush(self) -> None:
+        """Write queued lines; the caller holds the lock."""
+        while self._pending:
+            written = self._file.write(self._pending)
+            del self._pending[:written]
+
+
+def _close_files(files: "OrderedDict[str, _LineAppender]") -> None:
+    """Flush and close every handle in files, emptying it."""
+    while files:
+        _, f = files.popitem()
+        f.close()
+
+
+def _close_handles(handles: list[BinaryIO]) -> None:
+    """Close every handle in handles, emptying it."""
+    while handles:
+        handles.pop().close()
+
+
 class HistorySession(BaseModel):
     """Session metadata - stored in index.jsonl."""
 
+    # Immutable so HistoryStore can hand out the instances held in its index
+    model_config = ConfigDict(frozen=True)
+
     id: str
     agent_id: str
     source: str  # Serialized EventSource (e.g., "platform-telegram:123:456")
@@ -63,26 +145,27 @@ class HistoryMessage(BaseModel):
         Returns:
             New HistoryMessage instance
         """
-        # Extract tool_calls from assistant messages
+        get = message.get
+
+        # Extract tool_calls from assistant messages (single lookup)
+        raw_tool_calls = get("tool_calls")
         tool_calls = None
-        if message.get("tool_calls"):  # type: ignore[typeddict-item]
+        if raw_tool_calls:
             tool_calls = [
                 {
                     "id": tc.get("id"),
                     "type": tc.get("type", "function"),
                     "function": tc.get("function", {}),
                 }
-                for tc in message["tool_calls"]  # type: ignore[typeddict-item]
+                for tc in raw_tool_calls  # type: ignore[attr-defined]
             ]
 
-        # Extract tool_call_id from tool messages
-        tool_call_id = message.get("tool_call_id")  # type: ignore[typeddict-item]
-
         return cls(
             role=message["role"],  # type: ignore[arg-type]
-            content=str(message.get("content", "")),
+            content=str(get("content", "")),
             tool_calls=tool_calls,
-            tool_call_id=tool_call_id,  # type: ignore[arg-type]
+            # Extract tool_call_id from tool messages
+            tool_call_id=get("tool_call_id"),  # type: ignore[arg-type]
         )
 
     def to_message(self) -> Message:
@@ -92,28 +175,15 @@ class HistoryMessage(BaseModel):
         Returns:
             Message dict compatible with litellm
         """
+        message: dict[str, Any] = {"role": self.role, "content": self.content}
 
-        # Start with base message
-        base: dict[str, Any] = {
-            "role": self.role,
-            "content": self.content,
-        }
-
-        # Add tool_calls for assistant messages
+        # Assistant messages carry tool_calls, tool messages their tool_call_id
         if self.role == "assistant" and self.tool_calls:
-            # Build the full assistant message with tool_calls
-            return {
-                "role": "assistant",
-                "content": self.content,
-                "tool_calls": self.tool_calls,  # type: ignore[typeddict-item]
-            }  # type: ignore[return-value]
-
-        # Add tool_call_id for tool messages
-        if self.role == "tool" and self.tool_call_id:
-            base["tool_call_id"] = self.tool_call_id
-            return base  # type: ignore[return-value]
+            message["tool_calls"] = self.tool_calls
+        elif self.role == "tool" and self.tool_call_id:
+            message["tool_call_id"] = self.tool_call_id
 
-        return base  # type: ignore[return-value]
+        return message  # type: ignore[return-value]
 
 
 class HistoryStore:
@@ -122,7 +192,7 @@ class HistoryStore:
 
     Directory structure:
     ~/.pickle-bot/history/
-    ├── index.jsonl              # Session metadata (append-only)
+    ├── index.jsonl              # Session metadata (append-only, last line per id wins)
     └── sessions/
         └── {session_id}.jsonl   # Messages (append-only, one file per session)
     """
@@ -139,40 +209,223 @@ class HistoryStore:
         self.base_path.mkdir(parents=True, exist_ok=True)
         self.sessions_path.mkdir(parents=True, exist_ok=True)
 
+        # str forms for per-call stat/open, avoiding Path construction
+        self._index_file_name = str(self.index_path)
+        self._sessions_prefix = os.path.join(self.sessions_path, "")
+
+        # Buffered append handles for recently written sessions, most recent last
+        self._session_files: OrderedDict[str, _LineAppender] = OrderedDict()
+        # Flush pending messages if the store is dropped or the process exits
+        self._finalizer = weakref.finalize(self, _close_files, self._session_files)
+        # Sessions inside a session() block, with nesting depth; only these
+        # keep writes buffered, all others are flushed before the index update
+        self._held_sessions: dict[str, int] = {}
+
+        # Parsed messages per session as (inode, bytes parsed, mtime_ns,
+        # messages), LRU.
+        # get_messages runs on API worker threads too, so entries are only
+        # swapped under the lock; cached lists are never mutated.
+        self._message_cache: OrderedDict[
+            str, tuple[int, int, int, list[HistoryMessage]]
+        ] = OrderedDict()
+        self._message_cache_lock = threading.Lock()
+
+        # Session index replayed from index.jsonl, loaded on first use
+        self._index: dict[str, HistorySession] | None = None
+        self._index_lines = 0
+        self._index_signature_seen: tuple[int, int, int] | None = None
+        # Append handle for index.jsonl (at most one), opened on first write;
+        # a list so a single finalizer can close whichever handle is current
+        self._index_file: list[BinaryIO] = []
+        self._index_file_ino = 0
+        self._index_finalizer = weakref.finalize(self, _close_handles, self._index_file)
+        # Bumped on every index change; list_sessions re-sorts only when it moves
+        self._index_version = 0
+        self._sorted_sessions: list[HistorySession] = []
+        self._sorted_sessions_version = -1
+
     def _session_path(self, session_id: str) -> Path:
         """Get the file path for a session."""
-        return self.sessions_path / f"{session_id}.jsonl"
+        return Path(self._session_file_name(session_id))
 
-    def _read_index(self) -> list[HistorySession]:
-        """Read all session entries from index.jsonl."""
-        if not self.index_path.exists():
-            return []
+    def _session_file_name(self, session_id: str) -> str:
+        """Get the file path for a session as a str."""
+        return f"{self._sessions_prefix}{session_id}.jsonl"
 
-        sessions = []
-        with open(self.index_path) as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        sessions.append(HistorySession.model_validate_json(line))
-                    except Exception:
-                        continue
-        return sessions
-
-    def _write_index(self, sessions: list[HistorySession]) -> None:
-        """Write all session entries to index.jsonl."""
-        with open(self.index_path, "w") as f:
-            for session in sessions:
-                f.write(session.model_dump_json() + "\n")
-
-    def _find_session_index(
-        self, sessions: list[HistorySession], session_id: str
-    ) -> int:
-        """Find the index of a session in the list."""
-        for i, s in enumerate(sessions):
-            if s.id == session_id:
-                return i
-        return -1
+    def _session_file(self, session_id: str) -> _LineAppender:
+        """Get an open append handle for a session file, reusing held handles."""
+        f = self._session_files.get(session_id)
+        if f is not None:
+            self._session_files.move_to_end(session_id)
+            return f
+
+        f = _LineAppender(self._session_file_name(session_id))
+        self._session_files[session_id] = f
+        if len(self._session_files) > MAX_OPEN_SESSION_FILES:
+            _, oldest = self._session_files.popitem(last=False)
+            oldest.close()
+        return f
+
+    @contextmanager
+    def session(self, session_id: str) -> Iterator["HistoryStore"]:
+        """Hold a session's file open for a run of writes.
+
+        Messages saved inside the block are buffered; pending messages are
+        flushed and the handle released on exit.
+
+        Args:
+            session_id: Session identifier
+
+        Yields:
+            This store
+        """
+        self._session_file(session_id)
+        self._held_sessions[session_id] = self._held_sessions.get(session_id, 0) + 1
+        try:
+            yield self
+        finally:
+            depth = self._held_sessions.pop(session_id) - 1
+            if depth:
+                self._held_sessions[session_id] = depth
+            else:
+                self.close_session(session_id)
+
+    def close_session(self, session_id: str) -> None:
+        """Flush and close the held append handle for a session, if any."""
+        f = self._session_files.pop(session_id, None)
+        if f is not None:
+            f.close()
+
+    def sync(self, session_id: str | None = None) -> None:
+        """Flush buffered messages to disk.
+
+        Args:
+            session_id: Session to flush, or None to flush every open session
+        """
+        if session_id is None:
+            for f in self._session_files.values():
+                f.flush()
+        elif (f := self._session_files.get(session_id)) is not None:
+            f.flush()
+
+    def close(self) -> None:
+        """Flush and close all held session and index file handles.
+
+        index.jsonl is compacted to one line per session if it holds stale
+        update lines and nobody else has written it since our last write.
+        """
+        _close_files(self._session_files)
+        if (
+            self._index is not None
+            and self._index_lines > len(self._index)
+            and self._index_signature() == self._index_signature_seen
+        ):
+            self._write_index()
+        _close_handles(self._index_file)
+
+    def _index_signature(self) -> tuple[int, int, int] | None:
+        """(inode, mtime_ns, size) of index.jsonl, or None if it does not exist."""
+        try:
+            st = os.stat(self._index_file_name)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _read_index(self) -> dict[str, HistorySession]:
+        """Get the in-memory session index, replaying index.jsonl if it changed.
+
+        index.jsonl holds one line per create/update; the last line for an id
+        wins. The file is only re-read when its signature differs from the one
+        recorded after our own last write, i.e. when another process wrote it.
+        """
+        signature = self._index_signature()
+        if self._index is not None and signature == self._index_signature_seen:
+            return self._index
+
+        index: dict[str, HistorySession] = {}
+        lines = 0
+        if signature is not None:
+            with open(self.index_path, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        lines += 1
+                        try:
+                            session = HistorySession.model_validate_json(line)
+                        except Exception:
+                            continue
+                        index[session.id] = session
+
+        self._index = index
+        self._index_lines = lines
+        self._index_signature_seen = signature
+        self._index_version += 1
+        return index
+
+    def _append_index(self, session: HistorySession) -> None:
+        """Record a session entry, appending a line or compacting index.jsonl."""
+        index = self._read_index()
+        previous = index.get(session.id)
+        index[session.id] = session
+        self._update_sorted_sessions(previous, session)
+
+        if self._index_lines >= 2 * len(index) + INDEX_COMPACT_SLACK:
+            self._write_index()
+            return
+
+        # _read_index just stat'ed the path; reopen if it is a different file
+        signature = self._index_signature_seen
+        if (
+            not self._index_file
+            or signature is None
+            or signature[0] != self._index_file_ino
+        ):
+            f = self._open_index_file()
+        else:
+            f = self._index_file[0]
+
+        f.write(session.model_dump_json().encode() + b"\n")
+        self._index_lines += 1
+        st = os.fstat(f.fileno())
+        self._index_signature_seen = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _open_index_file(self) -> BinaryIO:
+        """(Re)open the held O_APPEND handle for index.jsonl."""
+        _close_handles(self._index_file)
+        # Unbuffered: each entry is one write, visible to other processes at
+        # once. Held open across writes; close() and the finalizer close it.
+        f = open(self.index_path, "ab", buffering=0)  # noqa: SIM115
+        self._index_file.append(f)
+        self._index_file_ino = os.fstat(f.fileno()).st_ino
+        return f
+
+    def _update_sorted_sessions(
+        self, previous: HistorySession | None, session: HistorySession
+    ) -> None:
+        """Bump the index version, patching the sorted listing if it is current.
+
+        Updates stamp updated_at with the current time, so the session almost
+        always moves to the front; only otherwise is a full re-sort needed.
+        """
+        listing = self._sorted_sessions
+        in_sync = self._sorted_sessions_version == self._index_version
+        self._index_version += 1
+        if not in_sync or (listing and session.updated_at < listing[0].updated_at):
+            return
+
+        if previous is not None:
+            # Match by identity; pydantic __eq__ would compare every field
+            del listing[next(i for i, s in enumerate(listing) if s is previous)]
+        listing.insert(0, session)
+        self._sorted_sessions_version = self._index_version
+
+    def _write_index(self) -> None:
+        """Rewrite index.jsonl with one line per session in the in-memory index."""
+        sessions = self._index.values() if self._index is not None else ()
+        with open(self.index_path, "wb") as f:
+            f.write(b"".join(s.model_dump_json().encode() + b"\n" for s in sessions))
+        self._index_lines = len(self._index or ())
+        self._index_signature_seen = self._index_signature()
 
     def create_session(
         self,
@@ -201,9 +454,7 @@ class HistoryStore:
             updated_at=now,
         )
 
-        # Append to index
-        with open(self.index_path, "a") as f:
-            f.write(session.model_dump_json() + "\n")
+        self._append_index(session)
 
         # Create session file
         self._session_path(session_id).touch()
@@ -212,37 +463,53 @@ class HistoryStore:
 
     def save_message(self, session_id: str, message: HistoryMessage) -> None:
         """Save a message to history."""
-        sessions = self._read_index()
-        idx = self._find_session_index(sessions, session_id)
-        if idx < 0:
-            raise ValueError(f"Session not found: {session_id}")
+        self.save_messages(session_id, [message])
 
-        session = sessions[idx]
+    def save_messages(
+        self, session_id: str, messages: Sequence[HistoryMessage]
+    ) -> None:
+        """Save several messages to history with one write and one index update.
 
-        # Append message to session file
-        session_file = self._session_path(session_id)
-        with open(session_file, "a") as f:
-            f.write(message.model_dump_json() + "\n")
-
-        # Update index
-        session.message_count += 1
-        session.updated_at = _now_iso()
+        Args:
+            session_id: Session identifier
+            messages: Messages in chronological order
+        """
+        session = self._read_index().get(session_id)
+        if session is None:
+            raise ValueError(f"Session not found: {session_id}")
+        if not messages:
+            return
+
+        f = self._session_file(session_id)
+        f.write(b"".join(m.model_dump_json().encode() + b"\n" for m in messages))
+        # Outside session() the messages must be on disk before the index
+        # counts them; inside it they are flushed when the block exits
+        if session_id not in self._held_sessions:
+            f.flush()
+
+        update: dict[str, Any] = {
+            "message_count": session.message_count + len(messages),
+            "updated_at": _now_iso(),
+        }
 
         # Auto-generate title from first user message
-        if session.title is None and message.role == "user":
-            title = message.content[:50]
-            if len(message.content) > 50:
-                title += "..."
-            session.title = title
+        if session.title is None:
+            first_user = next((m for m in messages if m.role == "user"), None)
+            if first_user is not None:
+                update["title"] = _make_title(first_user.content)
 
-        sessions.sort(key=lambda s: s.updated_at, reverse=True)
-        self._write_index(sessions)
+        self._append_index(session.model_copy(update=update))
 
     def list_sessions(self) -> list[HistorySession]:
         """List all sessions, most recently updated first."""
-        sessions = self._read_index()
-        sessions.sort(key=lambda s: s.updated_at, reverse=True)
-        return sessions
+        index = self._read_index()
+        if self._sorted_sessions_version != self._index_version:
+            # ISO timestamps from _now_iso sort chronologically as strings
+            self._sorted_sessions = sorted(
+                index.values(), key=attrgetter("updated_at"), reverse=True
+            )
+            self._sorted_sessions_version = self._index_version
+        return list(self._sorted_sessions)
 
     def get_messages(self, session_id: str) -> list[HistoryMessage]:
         """Get all messages for a session.
@@ -253,21 +520,69 @@ class HistoryStore:
         Returns:
             List of HistoryMessage objects in chronological order
         """
-        session_file = self._session_path(session_id)
-        if not session_file.exists():
+        self.sync(session_id)
+        session_file = self._session_file_name(session_id)
+
+        try:
+            st = os.stat(session_file)
+        except FileNotFoundError:
+            with self._message_cache_lock:
+                self._message_cache.pop(session_id, None)
             return []
 
-        messages: list[HistoryMessage] = []
-        with open(session_file) as f:
-            for line in f:
-                line = line.strip()
-                if line:
+        with self._message_cache_lock:
+            cached = self._message_cache.get(session_id)
+            # Same file, untouched since the last read: skip opening it at all
+            if cached is not None and cached[:3] == (
+                st.st_ino,
+                st.st_size,
+                st.st_mtime_ns,
+            ):
+                self._message_cache.move_to_end(session_id)
+                return list(cached[3])
+
+        # Unbuffered: the tail is read in one read() call, no BufferedReader needed
+        with open(session_file, "rb", buffering=0) as f:
+            st = os.fstat(f.fileno())
+            # Reuse parsed messages only if this is the same file and it grew;
+            # same size with a new mtime means it was rewritten in place
+            if (
+                cached is None
+                or cached[0] != st.st_ino
+                or cached[1] > st.st_size
+                or (cached[1] == st.st_size and cached[2] != st.st_mtime_ns)
+            ):
+                cached = (st.st_ino, 0, 0, [])
+            ino, offset, _, previous = cached
+
+            f.seek(offset)
+            data = f.read()
+            lines = data.split(b"\n")
+            # Leave a trailing partial line (b"" if none) for the next call
+            partial = lines.pop()
+            parsed: list[HistoryMessage] = []
+            for line in lines:
+                if line.strip():
                     try:
-                        messages.append(HistoryMessage.model_validate_json(line))
+                        parsed.append(HistoryMessage.model_validate_json(line))
                     except Exception:
                         continue
-
-        return messages
+            offset += len(data) - len(partial)
+            # After the read, so a concurrent append shows up as new bytes
+            mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+
+        # A new list, so readers holding the previous entry are unaffected
+        messages = previous + parsed
+        with self._message_cache_lock:
+            current = self._message_cache.get(session_id)
+            # Keep whichever concurrent reader got further into the file
+            if current is None or current[0] != ino or current[1] <= offset:
+                self._message_cache[session_id] = (ino, offset, mtime_ns, messages)
+            self._message_cache.move_to_end(session_id)
+            if len(self._message_cache) > MAX_CACHED_SESSIONS:
+                self._message_cache.popitem(last=False)
+
+        return list(messages)
 
     def get_session_info(self, session_id: str) -> HistorySession | None:
         """Get session metadata without loading messages.
@@ -278,8 +593,24 @@ class HistoryStore:
         Returns:
             HistorySession if found, None otherwise
         """
-        sessions = self._read_index()
-        for session in sessions:
-            if session.id == session_id:
-                return session
-        return None
+        return self._read_index().get(session_id)
+
+    def delete_session(self, session_id: str) -> bool:
+        """Delete a session's messages and index entry.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if the session existed, False otherwise
+        """
+        if self._read_index().pop(session_id, None) is None:
+            return False
+        self._index_version += 1
+
+        self.close_session(session_id)
+        with self._message_cache_lock:
+            self._message_cache.pop(session_id, None)
+        self._session_path(session_id).unlink(missing_ok=True)
+        self._write_index()
+        return True
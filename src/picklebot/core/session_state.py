@@ -29,6 +29,12 @@ class SessionState:
         history_msg = HistoryMessage.from_message(message)
         self.shared_context.history_store.save_message(self.session_id, history_msg)
 
+    def add_messages(self, messages: list[Message]) -> None:
+        """Add several messages to in-memory list + persist them in one write."""
+        self.messages.extend(messages)
+        history_msgs = [HistoryMessage.from_message(m) for m in messages]
+        self.shared_context.history_store.save_messages(self.session_id, history_msgs)
+
     def build_messages(self) -> list[Message]:
         system_prompt = self.shared_context.prompt_builder.build(self)
         messages: list[Message] = [{"role": "system", "content": system_prompt}]
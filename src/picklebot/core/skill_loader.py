@@ -1,14 +1,18 @@
 """Skill loader for discovering and loading skills."""
 
 import logging
+import os
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict, ValidationError
 
 from picklebot.utils.def_loader import (
+    DEFAULT_IGNORED_NAMES,
+    DefCache,
     DefNotFoundError,
     discover_definitions,
     get_template_variables,
+    read_definition,
     substitute_template,
 )
 
@@ -39,13 +43,21 @@ class SkillLoader:
 
     def __init__(self, config: "Config"):
         self.config = config
+        self._cache = DefCache()
 
     def discover_skills(self) -> list[SkillDef]:
         """Scan skills directory and return list of valid SkillDef."""
         return discover_definitions(
-            self.config.skills_path, "SKILL.md", self._parse_skill_def
+            self.config.skills_path, "SKILL.md", self._parse_skill_def, self._cache
         )
 
+    def invalidate(self, skill_id: str | None = None) -> None:
+        """Drop cached definitions for one skill, or all skills if no ID given."""
+        if skill_id is None:
+            self._cache.invalidate()
+        else:
+            self._cache.invalidate(self.config.skills_path / skill_id / "SKILL.md")
+
     def _parse_skill_def(
         self, def_id: str, frontmatter: dict[str, Any], body: str
     ) -> SkillDef | None:
@@ -76,10 +88,31 @@ class SkillLoader:
         Raises:
             DefNotFoundError: If skill doesn't exist
         """
-        # Use discover_skills which now returns full SkillDef objects
-        skills = self.discover_skills()
-        for skill in skills:
-            if skill.id == skill_id:
-                return skill
+        # Skill IDs are plain folder names; anything discovery would skip
+        # (dot-folders, ignored names, nested paths) is not a skill
+        if (
+            not skill_id
+            or skill_id.startswith(".")
+            or skill_id in DEFAULT_IGNORED_NAMES
+            or os.sep in skill_id
+            or "/" in skill_id
+        ):
+            raise DefNotFoundError("skill", skill_id)
+
+        # Read only the requested SKILL.md instead of discovering every skill
+        skill_file = self.config.skills_path / skill_id / "SKILL.md"
+        try:
+            skill_def = read_definition(
+                skill_file, skill_id, self._parse_skill_def, self._cache
+            )
+        except (FileNotFoundError, NotADirectoryError):
+            raise DefNotFoundError("skill", skill_id) from None
+        except Exception as e:
+            # Discovery skips skills that fail to parse, so they can't be loaded
+            logger.warning(f"Failed to parse skill '{skill_id}': {e}")
+            raise DefNotFoundError("skill", skill_id) from e
+
+        if skill_def is None:
+            raise DefNotFoundError("skill", skill_id)
 
-        raise DefNotFoundError("skill", skill_id)
+        return skill_def
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import shutil
+from collections.abc import Sequence
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -20,7 +21,7 @@ logger = logging.getLogger(__name__)
 
 
 def find_due_jobs(
-    jobs: list["CronDef"], now: datetime | None = None
+    jobs: Sequence["CronDef"], now: datetime | None = None
 ) -> list["CronDef"]:
     """
     Find all jobs that are due to run.
@@ -89,8 +90,14 @@ class CronWorker(Worker):
             await self.context.eventbus.publish(event)
             self.logger.info(f"Dispatched cron job: {cron_def.id}")
 
-            # Delete one-off crons after dispatching
-            if cron_def.one_off:
-                cron_path = self.context.cron_loader.config.crons_path / cron_def.id
-                shutil.rmtree(cron_path)
-                self.logger.info(f"Deleted one-off cron job: {cron_def.id}")
+            self._finalize_one_off(cron_def)
+
+    def _finalize_one_off(self, cron_def: "CronDef") -> None:
+        """Delete a one-off cron's folder after dispatch; recurring crons are kept."""
+        if not cron_def.one_off:
+            return
+
+        cron_path = self.context.cron_loader.config.crons_path / cron_def.id
+        shutil.rmtree(cron_path)
+        self.context.cron_loader.invalidate(cron_def.id)
+        self.logger.info(f"Deleted one-off cron job: {cron_def.id}")
@@ -48,6 +48,7 @@ class Server:
     def _setup_workers(self) -> None:
         """Create all workers."""
         self.config_reloader.start()
+        self.context.cron_loader.start_watching()
 
         # Create WebSocketWorker first and attach to context
         ws_worker = WebSocketWorker(self.context)
@@ -104,6 +105,9 @@ class Server:
         if self.config_reloader is not None:
             self.config_reloader.stop()
 
+        self.context.cron_loader.stop_watching()
+        self.context.history_store.close()
+
     async def _run_api(self) -> None:
         """Run the HTTP API server."""
         if not self.context.config.api:
@@ -1,6 +1,11 @@
 """Shared utilities for loading definition files (agents, skills, crons)."""
 
+import json
 import logging
+import os
+import re
+from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
@@ -9,9 +14,27 @@ import yaml
 if TYPE_CHECKING:
     from picklebot.utils.config import Config
 
+try:
+    # libyaml C binding, several times faster than the pure-Python loader
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
+_TEMPLATE_RE = re.compile(r"\{\{(\w+)\}\}")
+
+# discover_definitions reads files on a thread pool from this many cache misses up
+_PARALLEL_DISCOVERY_MIN = 8
+_PARALLEL_DISCOVERY_MAX_WORKERS = 16
+
+# Folder names discovery never treats as definitions (dot-folders are skipped too)
+DEFAULT_IGNORED_NAMES: frozenset[str] = frozenset({"__pycache__"})
+
+# DefCache entry: ((mtime_ns, size), (frontmatter, body))
+_CacheEntry = tuple[tuple[int, int], tuple[dict[str, Any], str]]
+
 
 class DefNotFoundError(Exception):
     """Definition folder or file doesn't exist."""
@@ -63,12 +86,113 @@ def substitute_template(body: str, variables: dict[str, str]) -> str:
     Returns:
         Body with all matching placeholders replaced
     """
-    result = body
-    # Sort by key length descending to handle overlapping names correctly
-    for key in sorted(variables.keys(), key=len, reverse=True):
-        value = variables[key]
-        result = result.replace(f"{{{{{key}}}}}", value)
-    return result
+    # Single pass over the body; unknown placeholders are left as-is
+    return _TEMPLATE_RE.sub(lambda match: variables.get(match[1], match[0]), body)
+
+
+# One "key: value" frontmatter line whose value YAML would read the same way
+# we do: a plain word-led string, a simple quoted string, or a decimal int.
+_SIMPLE_LINE_RE = re.compile(
+    r"(?P<key>[A-Za-z_][\w-]*):[ \t]+"
+    r"(?:'(?P<single>[^'\n]*)'"
+    r'|"(?P<double>[^"\\\n]*)"'
+    r"|(?P<int>0|-?[1-9][0-9]*)"
+    r"|(?P<plain>[A-Za-z_][^:#\n]*?))[ \t]*"
+)
+_YAML_BOOLS = {
+    "true": True,
+    "True": True,
+    "TRUE": True,
+    "false": False,
+    "False": False,
+    "FALSE": False,
+}
+# Plain words YAML 1.1 may resolve to bool/null; defer these to PyYAML
+_YAML_SPECIAL_WORDS = {"true", "false", "yes", "no", "on", "off", "y", "n", "null"}
+
+
+def _parse_simple_frontmatter(text: str) -> dict[str, Any] | None:
+    """
+    Parse flat "key: scalar" frontmatter without PyYAML.
+
+    Returns None if any line needs the full YAML parser (nesting, lists,
+    block scalars, comments, escapes, or ambiguous scalars).
+    """
+    data: dict[str, Any] = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+
+        match = _SIMPLE_LINE_RE.fullmatch(line)
+        if match is None:
+            return None
+
+        key = match["key"]
+        if key.lower() in _YAML_SPECIAL_WORDS:
+            return None
+
+        if match["single"] is not None:
+            data[key] = match["single"]
+        elif match["double"] is not None:
+            data[key] = match["double"]
+        elif match["int"] is not None:
+            data[key] = int(match["int"])
+        elif match["plain"] in _YAML_BOOLS:
+            data[key] = _YAML_BOOLS[match["plain"]]
+        elif match["plain"].lower() in _YAML_SPECIAL_WORDS:
+            return None
+        else:
+            data[key] = match["plain"]
+
+    return data
+
+
+def _load_frontmatter(text: str) -> dict[str, Any]:
+    """
+    Load frontmatter text into a dict.
+
+    Flat "key: scalar" frontmatter is parsed line by line and JSON-style
+    frontmatter with the json module, both much faster than PyYAML;
+    anything else falls back to YAML.
+    """
+    simple = _parse_simple_frontmatter(text)
+    if simple is not None:
+        return simple
+
+    if text.lstrip().startswith("{"):
+        try:
+            data = json.loads(text)
+        except ValueError:
+            pass
+        else:
+            if isinstance(data, dict):
+                return data
+
+    return yaml.load(text, Loader=YamlLoader) or {}
+
+
+def split_definition(content: str) -> tuple[dict[str, Any], str]:
+    """
+    Split a definition file into its YAML frontmatter and markdown body.
+
+    Args:
+        content: Raw file content
+
+    Returns:
+        Tuple of (frontmatter dict, body); frontmatter is empty if the file
+        has none
+    """
+    # Find frontmatter delimiters
+    if not content.startswith("---\n"):
+        return {}, content
+
+    end_delimiter = content.find("\n---\n", 4)
+    if end_delimiter == -1:
+        return {}, content
+
+    frontmatter_text = content[4:end_delimiter]
+    body = content[end_delimiter + 5 :]
+    return _load_frontmatter(frontmatter_text), body
 
 
 def parse_definition[T](
@@ -90,27 +214,111 @@ def parse_definition[T](
     Raises:
         Whatever parse_fn raises (e.g., ValidationError)
     """
-    # Find frontmatter delimiters
-    if not content.startswith("---\n"):
-        body = content
-        return parse_fn(def_id, {}, body)
+    frontmatter, body = split_definition(content)
+    return parse_fn(def_id, frontmatter, body)
 
-    end_delimiter = content.find("\n---\n", 4)
-    if end_delimiter == -1:
-        body = content
-        return parse_fn(def_id, {}, body)
 
-    frontmatter_text = content[4:end_delimiter]
-    body = content[end_delimiter + 5 :]
+def _read_text(path: str | os.PathLike[str]) -> str:
+    """Read a text file without going through pathlib."""
+    with open(path) as f:
+        return f.read()
 
-    raw_dict = yaml.safe_load(frontmatter_text) or {}
-    return parse_fn(def_id, raw_dict, body)
+
+class DefCache:
+    """
+    Split (frontmatter, body) of definition files keyed by absolute file path.
+
+    Entries are tagged with the (mtime_ns, size) of the file they were read
+    from. Parsed objects are not cached: the parse callback runs on every read
+    so template variables stay current.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, _CacheEntry] = {}
+
+    @staticmethod
+    def _key(def_file: str | os.PathLike[str]) -> str:
+        # abspath is string-only; resolving symlinks would cost syscalls per read
+        return os.path.abspath(def_file)
+
+    def get(
+        self, def_file: str | os.PathLike[str]
+    ) -> tuple[dict[str, Any], str] | None:
+        """
+        Return the cached split if the file is unchanged, without reading it.
+
+        Raises:
+            FileNotFoundError: If def_file doesn't exist
+        """
+        stat = os.stat(def_file)
+        cached = self._entries.get(self._key(def_file))
+        if cached is not None and cached[0] == (stat.st_mtime_ns, stat.st_size):
+            return cached[1]
+        return None
+
+    def read(self, def_file: str | os.PathLike[str]) -> tuple[dict[str, Any], str]:
+        """
+        Return the split definition file, re-reading it only if it changed.
+
+        Raises:
+            FileNotFoundError: If def_file doesn't exist
+        """
+        stat = os.stat(def_file)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        key = self._key(def_file)
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        split = split_definition(_read_text(def_file))
+        self._entries[key] = (signature, split)
+        return split
+
+    def invalidate(self, def_file: str | os.PathLike[str] | None = None) -> None:
+        """Drop one cached definition file, or all of them if none given."""
+        if def_file is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(self._key(def_file), None)
+
+
+def read_definition[T](
+    def_file: str | os.PathLike[str],
+    def_id: str,
+    parse_fn: Callable[[str, dict[str, Any], str], T],
+    cache: DefCache | None = None,
+) -> T:
+    """
+    Read and parse a definition file, reusing the cached split if unchanged.
+
+    Args:
+        def_file: Path to the definition file
+        def_id: Definition ID (passed to parse_fn for context)
+        parse_fn: Callback(def_id, frontmatter, body) -> typed object; called
+            on every read and must not mutate the frontmatter dict
+        cache: Optional cache; the file is only re-read and re-split when its
+            mtime or size changes
+
+    Returns:
+        The typed object returned by parse_fn
+
+    Raises:
+        FileNotFoundError: If def_file doesn't exist
+        Whatever parse_fn raises (e.g., ValidationError)
+    """
+    if cache is None:
+        return parse_definition(_read_text(def_file), def_id, parse_fn)
+
+    frontmatter, body = cache.read(def_file)
+    return parse_fn(def_id, frontmatter, body)
 
 
 def discover_definitions(
     path: Path,
     filename: str,
     parse_fn: Callable[[str, dict[str, Any], str], T | None],
+    cache: DefCache | None = None,
+    ignored_names: Collection[str] = (),
 ) -> list[T]:
     """
     Scan directory for definition files.
@@ -119,34 +327,92 @@ def discover_definitions(
         path: Directory containing definition folders
         filename: File to look for (e.g., "AGENT.md", "SKILL.md")
         parse_fn: Callback(def_id, frontmatter, body) -> Metadata or None
-        logger: For warnings on missing/invalid files
+        cache: Optional DefCache of split definition files
+        ignored_names: Extra folder names to skip without touching the
+            filesystem; DEFAULT_IGNORED_NAMES and folders starting with "."
+            are always skipped
 
     Returns:
         List of metadata objects from successful parses
     """
-    if not path.exists():
+    try:
+        entries = list(os.scandir(path))
+    except FileNotFoundError:
         logger.warning(f"Definitions directory not found: {path}")
         return []
 
-    results = []
-    for def_dir in path.iterdir():
-        if not def_dir.is_dir():
-            continue
+    ignored = DEFAULT_IGNORED_NAMES.union(ignored_names)
+    # Name checks are free; DirEntry.is_dir() answers from the directory
+    # listing, no extra stat
+    def_dirs = [
+        entry
+        for entry in entries
+        if not entry.name.startswith(".")
+        and entry.name not in ignored
+        and entry.is_dir()
+    ]
+
+    def def_file(entry: os.DirEntry[str]) -> str:
+        # Plain string join; a Path per entry only adds allocations here
+        return os.path.join(entry.path, filename)
+
+    def guarded[R](
+        entry: os.DirEntry[str], fn: Callable[..., R], *args: Any
+    ) -> R | None:
+        # Reading, splitting and parsing failures all just skip the folder
+        try:
+            return fn(*args)
+        except FileNotFoundError:
+            # A failed stat/open is one syscall; listing the folder to look
+            # for the file first would cost more for every definition.
+            logger.warning(f"No {filename} found in {entry.name}")
+        except Exception as e:
+            logger.warning(f"Failed to parse {entry.name}: {e}")
+        return None
 
-        def_file = def_dir / filename
-        if not def_file.exists():
-            logger.warning(f"No {filename} found in {def_dir.name}")
-            continue
+    def read_split(entry: os.DirEntry[str]) -> tuple[dict[str, Any], str]:
+        if cache is None:
+            return split_definition(_read_text(def_file(entry)))
+        return cache.read(def_file(entry))
+
+    def split_one(entry: os.DirEntry[str]) -> tuple[dict[str, Any], str] | None:
+        return guarded(entry, read_split, entry)
 
+    splits: dict[str, tuple[dict[str, Any], str] | None] = {}
+    pending: list[os.DirEntry[str]] = []
+    for entry in def_dirs:
         try:
-            content = def_file.read_text()
-            result = parse_definition(content, def_dir.name, parse_fn)
-            if result is not None:
-                results.append(result)
-        except Exception as e:
-            logger.warning(f"Failed to parse {def_dir.name}: {e}")
-            continue
+            cached = None if cache is None else cache.get(def_file(entry))
+        except OSError:
+            cached = None  # split_one reports the failure
+        if cached is None:
+            pending.append(entry)
+        else:
+            splits[entry.name] = cached
+
+    # Cache hits are a stat each; only overlap reads when enough files
+    # actually need reading to be worth a pool
+    if len(pending) < _PARALLEL_DISCOVERY_MIN:
+        for entry in pending:
+            splits[entry.name] = split_one(entry)
+    else:
+        workers = min(_PARALLEL_DISCOVERY_MAX_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            splits.update(
+                zip(
+                    (entry.name for entry in pending),
+                    executor.map(split_one, pending),
+                )
+            )
 
+    results = []
+    for entry in def_dirs:
+        split = splits[entry.name]
+        if split is None:
+            continue
+        result = guarded(entry, parse_fn, entry.name, *split)
+        if result is not None:
+            results.append(result)
     return results
 
 
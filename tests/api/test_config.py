@@ -2,8 +2,6 @@
 
 import pytest
 from fastapi.testclient import TestClient
-from pathlib import Path
-import tempfile
 import yaml
 
 from picklebot.api import create_app
@@ -13,32 +11,31 @@ from picklebot.utils.config import Config
 
 
 @pytest.fixture
-def client():
+def client(tmp_path):
     """Create test client with temporary workspace."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        workspace = Path(tmpdir)
-
-        # Write complete config to YAML so reload() works
-        user_config = workspace / "config.user.yaml"
-        user_config.write_text(
-            yaml.dump(
-                {
-                    "llm": {
-                        "provider": "openai",
-                        "model": "gpt-4",
-                        "api_key": "test-key",
-                    },
-                    "default_agent": "pickle",
-                }
-            )
+    workspace = tmp_path
+
+    # Write complete config to YAML so reload() works
+    user_config = workspace / "config.user.yaml"
+    user_config.write_text(
+        yaml.dump(
+            {
+                "llm": {
+                    "provider": "openai",
+                    "model": "gpt-4",
+                    "api_key": "test-key",
+                },
+                "default_agent": "pickle",
+            }
         )
+    )
 
-        config = Config.load(workspace)
-        context = SharedContext(config)
-        app = create_app(context)
+    config = Config.load(workspace)
+    context = SharedContext(config)
+    app = create_app(context)
 
-        with TestClient(app) as client:
-            yield client, workspace
+    with TestClient(app) as client:
+        yield client, workspace
 
 
 class TestGetConfig:
@@ -1,5 +1,7 @@
 """Tests for crons API router."""
 
+from unittest.mock import patch
+
 import pytest
 
 from picklebot.api.schemas import CronCreate
@@ -123,6 +125,25 @@ class TestUpdateCron:
         assert cron["schedule"] == "*/15 * * * *"
         assert cron["one_off"] is True
 
+    def test_update_cron_invalidates_cached_definition(self, client):
+        """PUT /crons/{id} drops the cached definition before reloading it."""
+        loader = client.app.state.context.cron_loader
+        cron_data = CronCreate(
+            name="Updated Cron",
+            description="An updated cron",
+            agent="pickle",
+            schedule="0 * * * *",
+            prompt="Updated prompt.",
+        )
+
+        with patch.object(
+            loader, "invalidate", wraps=loader.invalidate
+        ) as mock_invalidate:
+            response = client.put("/crons/test-cron", json=cron_data.model_dump())
+
+        assert response.status_code == 200
+        mock_invalidate.assert_called_once_with("test-cron")
+
     def test_update_cron_not_found(self, client):
         """PUT /crons/{id} returns 404 for non-existent cron."""
         cron_data = CronCreate(
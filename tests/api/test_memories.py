@@ -2,8 +2,6 @@
 
 import pytest
 from fastapi.testclient import TestClient
-from pathlib import Path
-import tempfile
 
 from picklebot.api import create_app
 from picklebot.core.context import SharedContext
@@ -11,18 +9,33 @@ from picklebot.utils.config import Config, LLMConfig
 
 
 @pytest.fixture
-def client():
+def client(tmp_path):
     """Create test client with temporary workspace."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        workspace = Path(tmpdir)
-        memories_path = workspace / "memories"
-        topics_path = memories_path / "topics"
-        topics_path.mkdir(parents=True)
-
-        # Create a test memory
-        (topics_path / "preferences.md").write_text(
-            "# User Preferences\n\nLikes: Python"
-        )
+    workspace = tmp_path
+    memories_path = workspace / "memories"
+    topics_path = memories_path / "topics"
+    topics_path.mkdir(parents=True)
+
+    # Create a test memory
+    (topics_path / "preferences.md").write_text("# User Preferences\n\nLikes: Python")
+
+    config = Config(
+        workspace=workspace,
+        llm=LLMConfig(provider="openai", model="gpt-4", api_key="test-key"),
+        default_agent="pickle",
+    )
+    context = SharedContext(config)
+    app = create_app(context)
+
+    with TestClient(app) as client:
+        yield client
+
+
+class TestListMemories:
+    def test_list_memories_returns_empty_list_when_no_memories(self, tmp_path):
+        """GET /memories returns empty list when no memories exist."""
+        workspace = tmp_path
+        (workspace / "memories").mkdir()
 
         config = Config(
             workspace=workspace,
@@ -33,26 +46,7 @@ def client():
         app = create_app(context)
 
         with TestClient(app) as client:
-            yield client
-
-
-class TestListMemories:
-    def test_list_memories_returns_empty_list_when_no_memories(self):
-        """GET /memories returns empty list when no memories exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace = Path(tmpdir)
-            (workspace / "memories").mkdir()
-
-            config = Config(
-                workspace=workspace,
-                llm=LLMConfig(provider="openai", model="gpt-4", api_key="test-key"),
-                default_agent="pickle",
-            )
-            context = SharedContext(config)
-            app = create_app(context)
-
-            with TestClient(app) as client:
-                response = client.get("/memories")
+            response = client.get("/memories")
 
         assert response.status_code == 200
         assert response.json() == []
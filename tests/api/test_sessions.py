@@ -2,8 +2,6 @@
 
 import pytest
 from fastapi.testclient import TestClient
-from pathlib import Path
-import tempfile
 
 from picklebot.api import create_app
 from picklebot.core.context import SharedContext
@@ -12,52 +10,50 @@ from picklebot.utils.config import Config, LLMConfig
 
 
 @pytest.fixture
-def client():
+def client(tmp_path):
     """Create test client with temporary workspace."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        workspace = Path(tmpdir)
-        history_path = workspace / ".history"
-        history_path.mkdir()
+    workspace = tmp_path
+    history_path = workspace / ".history"
+    history_path.mkdir()
 
-        config = Config(
-            workspace=workspace,
-            llm=LLMConfig(provider="openai", model="gpt-4", api_key="test-key"),
-            default_agent="pickle",
-        )
-        context = SharedContext(config)
+    config = Config(
+        workspace=workspace,
+        llm=LLMConfig(provider="openai", model="gpt-4", api_key="test-key"),
+        default_agent="pickle",
+    )
+    context = SharedContext(config)
 
-        # Create a test session
-        context.history_store.create_session(
-            "pickle", "test-session", source="telegram:user_123"
-        )
-        context.history_store.save_message(
-            "test-session",
-            HistoryMessage(role="user", content="Hello"),
-        )
+    # Create a test session
+    context.history_store.create_session(
+        "pickle", "test-session", source="telegram:user_123"
+    )
+    context.history_store.save_message(
+        "test-session",
+        HistoryMessage(role="user", content="Hello"),
+    )
 
-        app = create_app(context)
+    app = create_app(context)
 
-        with TestClient(app) as client:
-            yield client
+    with TestClient(app) as client:
+        yield client
 
 
 class TestListSessions:
-    def test_list_sessions_returns_empty_list_when_no_sessions(self):
+    def test_list_sessions_returns_empty_list_when_no_sessions(self, tmp_path):
         """GET /sessions returns empty list when no sessions exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace = Path(tmpdir)
-            (workspace / ".history").mkdir()
+        workspace = tmp_path
+        (workspace / ".history").mkdir()
 
-            config = Config(
-                workspace=workspace,
-                llm=LLMConfig(provider="openai", model="gpt-4", api_key="test-key"),
-                default_agent="pickle",
-            )
-            context = SharedContext(config)
-            app = create_app(context)
+        config = Config(
+            workspace=workspace,
+            llm=LLMConfig(provider="openai", model="gpt-4", api_key="test-key"),
+            default_agent="pickle",
+        )
+        context = SharedContext(config)
+        app = create_app(context)
 
-            with TestClient(app) as client:
-                response = client.get("/sessions")
+        with TestClient(app) as client:
+            response = client.get("/sessions")
 
         assert response.status_code == 200
         assert response.json() == []
@@ -104,41 +100,40 @@ class TestGetSession:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    def test_get_session_with_multiple_messages(self, client):
+    def test_get_session_with_multiple_messages(self, client, tmp_path):
         """GET /sessions/{id} returns all messages in order."""
         # Create a new session with multiple messages
-        with tempfile.TemporaryDirectory() as tmpdir:
-            workspace = Path(tmpdir)
-            history_path = workspace / ".history"
-            history_path.mkdir()
-
-            config = Config(
-                workspace=workspace,
-                llm=LLMConfig(provider="openai", model="gpt-4", api_key="test-key"),
-                default_agent="pickle",
-            )
-            context = SharedContext(config)
-
-            context.history_store.create_session(
-                "pickle", "multi-session", source="telegram:user_456"
-            )
-            context.history_store.save_message(
-                "multi-session",
-                HistoryMessage(role="user", content="First"),
-            )
-            context.history_store.save_message(
-                "multi-session",
-                HistoryMessage(role="assistant", content="Second"),
-            )
-            context.history_store.save_message(
-                "multi-session",
-                HistoryMessage(role="user", content="Third"),
-            )
-
-            app = create_app(context)
-
-            with TestClient(app) as client:
-                response = client.get("/sessions/multi-session")
+        workspace = tmp_path / "multi"
+        history_path = workspace / ".history"
+        history_path.mkdir(parents=True)
+
+        config = Config(
+            workspace=workspace,
+            llm=LLMConfig(provider="openai", model="gpt-4", api_key="test-key"),
+            default_agent="pickle",
+        )
+        context = SharedContext(config)
+
+        context.history_store.create_session(
+            "pickle", "multi-session", source="telegram:user_456"
+        )
+        context.history_store.save_message(
+            "multi-session",
+            HistoryMessage(role="user", content="First"),
+        )
+        context.history_store.save_message(
+            "multi-session",
+            HistoryMessage(role="assistant", content="Second"),
+        )
+        context.history_store.save_message(
+            "multi-session",
+            HistoryMessage(role="user", content="Third"),
+        )
+
+        app = create_app(context)
+
+        with TestClient(app) as client:
+            response = client.get("/sessions/multi-session")
 
         assert response.status_code == 200
         session = response.json()
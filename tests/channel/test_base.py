@@ -39,66 +39,38 @@ class MockChannel(Channel[Any]):
 
 
 @pytest.mark.parametrize(
-    "channel_type,config_factory,context_factory",
+    "channel_cls,config_cls,source_factory",
     [
         (
-            "telegram",
-            lambda: TelegramConfig(
-                bot_token="test-token", allowed_user_ids=["whitelisted"]
-            ),
+            TelegramChannel,
+            TelegramConfig,
             lambda user_id: TelegramEventSource(user_id=user_id, chat_id="123"),
         ),
         (
-            "discord",
-            lambda: DiscordConfig(
-                bot_token="test-token", allowed_user_ids=["whitelisted"]
-            ),
+            DiscordChannel,
+            DiscordConfig,
             lambda user_id: DiscordEventSource(user_id=user_id, channel_id="123"),
         ),
     ],
+    ids=["telegram", "discord"],
 )
-class TestChannelIsAllowed:
-    """Shared tests for is_allowed across all channel implementations."""
-
-    def test_is_allowed_returns_true_for_whitelisted_user(
-        self, channel_type, config_factory, context_factory
-    ):
-        """is_allowed should return True for whitelisted user."""
-        config = config_factory()
-        if channel_type == "telegram":
-            channel = TelegramChannel(config)
-        else:
-            channel = DiscordChannel(config)
-
-        ctx = context_factory("whitelisted")
-        assert channel.is_allowed(ctx) is True
-
-    def test_is_allowed_returns_false_for_non_whitelisted_user(
-        self, channel_type, config_factory, context_factory
-    ):
-        """is_allowed should return False for non-whitelisted user."""
-        config = config_factory()
-        if channel_type == "telegram":
-            channel = TelegramChannel(config)
-        else:
-            channel = DiscordChannel(config)
-
-        ctx = context_factory("unknown")
-        assert channel.is_allowed(ctx) is False
-
-    def test_is_allowed_returns_true_when_whitelist_empty(
-        self, channel_type, config_factory, context_factory
-    ):
-        """is_allowed should return True when whitelist is empty."""
-        if channel_type == "telegram":
-            config = TelegramConfig(bot_token="test-token", allowed_user_ids=[])
-            channel = TelegramChannel(config)
-        else:
-            config = DiscordConfig(bot_token="test-token", allowed_user_ids=[])
-            channel = DiscordChannel(config)
-
-        ctx = context_factory("anyone")
-        assert channel.is_allowed(ctx) is True
+@pytest.mark.parametrize(
+    "allowed_user_ids,user_id,expected",
+    [
+        (["whitelisted"], "whitelisted", True),
+        (["whitelisted"], "unknown", False),
+        ([], "anyone", True),
+    ],
+    ids=["whitelisted_user", "non_whitelisted_user", "empty_whitelist"],
+)
+def test_channel_is_allowed(
+    channel_cls, config_cls, source_factory, allowed_user_ids, user_id, expected
+):
+    """is_allowed honours the whitelist, and an empty whitelist allows everyone."""
+    config = config_cls(bot_token="test-token", allowed_user_ids=allowed_user_ids)
+    channel = channel_cls(config)
+
+    assert channel.is_allowed(source_factory(user_id)) is expected
 
 
 def test_channel_from_config_empty(tmp_path):
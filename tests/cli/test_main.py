@@ -1,7 +1,5 @@
 """Tests for CLI main module."""
 
-import tempfile
-from pathlib import Path
 from unittest.mock import patch
 
 from typer.testing import CliRunner
@@ -20,32 +18,30 @@ def test_init_command_exists():
     )
 
 
-def test_no_config_shows_init_instructions():
+def test_no_config_shows_init_instructions(tmp_path):
     """Test that missing config shows instructions to run init."""
     runner = CliRunner()
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        workspace = Path(tmpdir) / "no-config"
+    workspace = tmp_path / "no-config"
 
-        result = runner.invoke(app, ["--workspace", str(workspace), "chat"])
+    result = runner.invoke(app, ["--workspace", str(workspace), "chat"])
 
-        # Should exit with error
-        assert result.exit_code == 1
-        # Should show instructions to run init
-        assert "picklebot init" in result.output.lower()
+    # Should exit with error
+    assert result.exit_code == 1
+    # Should show instructions to run init
+    assert "picklebot init" in result.output.lower()
 
 
-def test_init_skips_config_check():
+def test_init_skips_config_check(tmp_path):
     """Test that init command works without existing config."""
     runner = CliRunner()
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        workspace = Path(tmpdir) / "no-config"
+    workspace = tmp_path / "no-config"
 
-        with patch("picklebot.cli.onboarding.OnboardingWizard.run") as mock_run:
-            result = runner.invoke(app, ["--workspace", str(workspace), "init"])
+    with patch("picklebot.cli.onboarding.OnboardingWizard.run") as mock_run:
+        result = runner.invoke(app, ["--workspace", str(workspace), "init"])
 
-        # Should call wizard exactly once
-        mock_run.assert_called_once()
-        # Should exit successfully
-        assert result.exit_code == 0
+    # Should call wizard exactly once
+    mock_run.assert_called_once()
+    # Should exit successfully
+    assert result.exit_code == 0
@@ -13,9 +13,9 @@ from picklebot.core.history import HistoryStore
 from picklebot.utils.config import Config, LLMConfig
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def llm_config() -> LLMConfig:
-    """Minimal LLM config for testing."""
+    """Minimal LLM config for testing (shared; treat as read-only)."""
     return LLMConfig(provider="openai", model="gpt-4", api_key="test-key")
 
 
@@ -49,9 +49,9 @@ def test_agent(test_context: SharedContext, test_agent_def: AgentDef) -> Agent:
     return Agent(agent_def=test_agent_def, context=test_context)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def shared_llm() -> LLMConfig:
-    """Shared LLM config for loader tests."""
+    """Shared LLM config for loader tests (treat as read-only)."""
     return LLMConfig(provider="test", model="test-model", api_key="test-key")
 
 
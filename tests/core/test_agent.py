@@ -207,27 +207,23 @@ class TestAgentNewSessionWithSource:
 
         assert session.source == source
 
-    def test_new_session_includes_post_message_for_cron(
-        self, mock_context, mock_agent_def
-    ):
-        """new_session should include post_message tool for cron sources."""
-        agent = Agent(mock_agent_def, mock_context)
-        source = CronEventSource(cron_id="daily_job")
-        session = agent.new_session(source=source)
-
-        tool_names = [s["function"]["name"] for s in session.tools.get_tool_schemas()]
-        assert "post_message" in tool_names
-
-    def test_new_session_excludes_post_message_for_chat(
-        self, mock_context, mock_agent_def
+    @pytest.mark.parametrize(
+        "source,expected",
+        [
+            (CronEventSource(cron_id="daily_job"), True),
+            (TelegramEventSource(user_id="user_123", chat_id="chat_456"), False),
+        ],
+        ids=["cron", "chat"],
+    )
+    def test_new_session_post_message_by_source(
+        self, mock_context, mock_agent_def, source, expected
     ):
-        """new_session should NOT include post_message tool for chat sources."""
+        """new_session should include post_message only for cron sources."""
         agent = Agent(mock_agent_def, mock_context)
-        source = TelegramEventSource(user_id="user_123", chat_id="chat_456")
         session = agent.new_session(source=source)
 
         tool_names = [s["function"]["name"] for s in session.tools.get_tool_schemas()]
-        assert "post_message" not in tool_names
+        assert ("post_message" in tool_names) == expected
 
     def test_new_session_persists_source_to_history(self, mock_context, mock_agent_def):
         """new_session should persist source to HistoryStore."""
@@ -371,3 +367,43 @@ class TestSessionRollingIntegration:
         assert len(new_session_messages) >= 1
         # The assistant response should be persisted to the new session
         assert any(m.role == "assistant" for m in new_session_messages)
+
+    async def test_roll_mid_turn_flushes_new_session(self, test_agent):
+        """Messages written to the rolled session are on disk when chat returns."""
+        from unittest.mock import AsyncMock, patch
+
+        from picklebot.core.context_guard import ContextGuard
+        from picklebot.core.history import HistoryStore
+
+        source = TelegramEventSource(user_id="123", chat_id="456")
+        session = test_agent.new_session(source=source)
+        history_store = test_agent.context.history_store
+        roll = ContextGuard.compact_and_roll
+
+        async def compact(guard, state):
+            return await roll(guard, state)
+
+        with (
+            patch.object(
+                test_agent.llm,
+                "chat",
+                new_callable=AsyncMock,
+                return_value=("Response", []),
+            ),
+            patch.object(ContextGuard, "check_and_compact", compact),
+            patch.object(
+                ContextGuard,
+                "_build_compacted_messages",
+                new_callable=AsyncMock,
+                return_value=[{"role": "user", "content": "Summary"}],
+            ),
+        ):
+            await session.chat("Hello")
+
+        new_session_id = session.session_id
+        assert history_store._session_files == {}
+        # Another process sees exactly what the index claims
+        reader = HistoryStore(history_store.base_path)
+        messages = reader.get_messages(new_session_id)
+        assert [m.role for m in messages] == ["user", "assistant"]
+        assert reader.get_session_info(new_session_id).message_count == 2
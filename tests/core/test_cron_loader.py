@@ -1,9 +1,20 @@
 """Tests for CronLoader and related components."""
 
+import os
+import threading
+from unittest.mock import patch
+
 import pytest
 from pydantic import ValidationError
+from watchdog.events import (
+    FileClosedNoWriteEvent,
+    FileModifiedEvent,
+    FileOpenedEvent,
+)
 
-from picklebot.core.cron_loader import CronDef, CronLoader
+from picklebot.core.cron_loader import CronDef, CronHandler, CronLoader
+from picklebot.utils.def_loader import discover_definitions, split_definition
+from tests.helpers import create_test_cron
 
 
 def test_cron_def_requires_description(tmp_path):
@@ -20,6 +31,21 @@ def test_cron_def_requires_description(tmp_path):
     assert "description" in str(exc_info.value)
 
 
+def test_cron_def_is_immutable():
+    """CronDef instances are shared via the discovery snapshot, so they are frozen."""
+    cron_def = CronDef(
+        id="test",
+        name="Test Cron",
+        description="Test description",
+        agent="pickle",
+        schedule="0 * * * *",
+        prompt="Test prompt",
+    )
+
+    with pytest.raises(ValidationError):
+        cron_def.prompt = "Changed"  # type: ignore[misc]
+
+
 class TestCronLoader:
     """Test CronLoader class."""
 
@@ -34,22 +60,11 @@ class TestCronLoader:
         self, test_config, one_off, expected_one_off
     ):
         """Load cron with various field combinations."""
-        crons_dir = test_config.crons_path
-        crons_dir.mkdir(parents=True, exist_ok=True)
-
-        cron_dir = crons_dir / "test-cron"
-        cron_dir.mkdir()
-
-        one_off_yaml = f"one_off: {one_off}\n" if one_off is not None else ""
-        (cron_dir / "CRON.md").write_text(
-            f"---\n"
-            f"name: Test Cron\n"
-            f"description: Test description\n"
-            f"agent: pickle\n"
-            f"schedule: '*/15 * * * *'\n"
-            f"{one_off_yaml}"
-            f"---\n"
-            f"Test prompt."
+        create_test_cron(
+            test_config.workspace,
+            schedule="*/15 * * * *",
+            prompt="Test prompt.",
+            one_off=one_off,
         )
 
         loader = CronLoader(test_config)
@@ -63,19 +78,8 @@ class TestCronLoader:
 
     def test_substitutes_template_variables(self, test_config):
         """Cron prompt can use template variables."""
-        crons_dir = test_config.crons_path
-        crons_dir.mkdir(parents=True, exist_ok=True)
-
-        cron_dir = crons_dir / "test-cron"
-        cron_dir.mkdir()
-        (cron_dir / "CRON.md").write_text(
-            "---\n"
-            "name: Test Cron\n"
-            "description: Test template substitution\n"
-            "agent: pickle\n"
-            "schedule: '0 * * * *'\n"
-            "---\n"
-            "Check memories at {{memories_path}}"
+        create_test_cron(
+            test_config.workspace, prompt="Check memories at {{memories_path}}"
         )
 
         loader = CronLoader(test_config)
@@ -86,38 +90,22 @@ class TestCronLoader:
 
     def test_discover_crons(self, test_config):
         """Discover all valid cron jobs including one_off variations."""
-        crons_dir = test_config.crons_path
-        crons_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create recurring cron
-        cron_dir = crons_dir / "recurring-job"
-        cron_dir.mkdir()
-        (cron_dir / "CRON.md").write_text(
-            "---\n"
-            "name: Recurring Job\n"
-            "description: A recurring job\n"
-            "agent: pickle\n"
-            "schedule: '*/5 * * * *'\n"
-            "---\n"
-            "Do repeatedly."
+        create_test_cron(
+            test_config.workspace,
+            cron_id="recurring-job",
+            schedule="*/5 * * * *",
+            prompt="Do repeatedly.",
         )
-
-        # Create one-off cron
-        cron_dir2 = crons_dir / "one-off-job"
-        cron_dir2.mkdir()
-        (cron_dir2 / "CRON.md").write_text(
-            "---\n"
-            "name: One Off Job\n"
-            "description: A one-off job\n"
-            "agent: pickle\n"
-            "schedule: '0 10 18 2 *'\n"
-            "one_off: true\n"
-            "---\n"
-            "Do once."
+        create_test_cron(
+            test_config.workspace,
+            cron_id="one-off-job",
+            schedule="0 10 18 2 *",
+            prompt="Do once.",
+            one_off=True,
         )
 
         # Create a directory without CRON.md (should be skipped)
-        (crons_dir / "no-file").mkdir()
+        (test_config.crons_path / "no-file").mkdir()
 
         loader = CronLoader(test_config)
         defs = loader.discover_crons()
@@ -133,3 +121,168 @@ class TestCronLoader:
 
         assert recurring.one_off is False
         assert one_off.one_off is True
+
+    def test_ignored_names_are_not_discovered(self, test_config):
+        """Folders listed in ignored_names are never treated as crons."""
+        create_test_cron(test_config.workspace, cron_id="real-job")
+        create_test_cron(test_config.workspace, cron_id="templates")
+        create_test_cron(test_config.workspace, cron_id="__pycache__")
+
+        loader = CronLoader(test_config, ignored_names={"templates"})
+
+        assert [c.id for c in loader.discover_crons()] == ["real-job"]
+
+
+class TestCronLoaderCache:
+    """Test CronLoader reuse of split CRON.md files."""
+
+    def test_unchanged_file_is_not_reparsed(self, test_config):
+        """Repeated loads and discovery reuse the parsed definition."""
+        create_test_cron(test_config.workspace)
+        loader = CronLoader(test_config)
+
+        with patch(
+            "picklebot.utils.def_loader.split_definition",
+            wraps=split_definition,
+        ) as mock_split:
+            first = loader.load("test-cron")
+            second = loader.load("test-cron")
+            discovered = loader.discover_crons()
+
+        assert mock_split.call_count == 1
+        assert first == second
+        assert discovered == (first,)
+
+    def test_template_variables_follow_config_changes(self, test_config, tmp_path):
+        """Cached files are re-substituted with the current config paths."""
+        create_test_cron(test_config.workspace, prompt="See {{memories_path}}")
+        loader = CronLoader(test_config)
+        loader.load("test-cron")
+
+        new_memories = tmp_path / "elsewhere"
+        test_config.memories_path = new_memories
+
+        assert loader.load("test-cron").prompt == f"See {new_memories}"
+        assert loader.discover_crons()[0].prompt == f"See {new_memories}"
+
+    def test_crons_path_change_drops_cache(self, test_config, tmp_path):
+        """A same-named cron in the new crons_path is not served from the cache."""
+        old_file = create_test_cron(test_config.workspace, prompt="Old.") / "CRON.md"
+        new_file = create_test_cron(tmp_path / "other", prompt="New!") / "CRON.md"
+        # Same folder name, size and mtime: only the directory differs
+        stat = old_file.stat()
+        os.utime(new_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        loader = CronLoader(test_config)
+        assert loader.load("test-cron").prompt == "Old."
+
+        test_config.crons_path = tmp_path / "other" / "crons"
+
+        assert loader.load("test-cron").prompt == "New!"
+
+
+class TestCronLoaderWatching:
+    """Test discovery snapshots backed by the filesystem watcher."""
+
+    def test_discovery_reused_while_watching(self, test_config):
+        """Unchanged crons directory is not rescanned while watching."""
+        create_test_cron(test_config.workspace, cron_id="job-a")
+        loader = CronLoader(test_config)
+        loader.start_watching()
+        try:
+            with patch(
+                "picklebot.core.cron_loader.discover_definitions",
+                wraps=discover_definitions,
+            ) as mock_discover:
+                first = loader.discover_crons()
+                second = loader.discover_crons()
+
+            assert mock_discover.call_count == 1
+            assert first is second
+            assert [c.id for c in first] == ["job-a"]
+        finally:
+            loader.stop_watching()
+
+    def test_path_change_invalidates_snapshot(self, test_config):
+        """A change inside a cron folder drops the snapshot and that cron's cache."""
+        create_test_cron(test_config.workspace, cron_id="job-a")
+        loader = CronLoader(test_config)
+        loader.start_watching()
+        try:
+            loader.discover_crons()
+            create_test_cron(test_config.workspace, cron_id="job-b")
+
+            loader._on_path_changed(str(test_config.crons_path / "job-b" / "CRON.md"))
+
+            assert sorted(c.id for c in loader.discover_crons()) == ["job-a", "job-b"]
+        finally:
+            loader.stop_watching()
+
+    def test_event_during_scan_is_not_overwritten(self, test_config):
+        """A watcher event that lands mid-scan keeps the stale result uncached."""
+        create_test_cron(test_config.workspace, cron_id="job-a")
+        loader = CronLoader(test_config)
+        loader.start_watching()
+        cron_file = str(test_config.crons_path / "job-a" / "CRON.md")
+
+        def scan_with_event(*args):
+            result = discover_definitions(*args)
+            event = threading.Thread(target=loader._on_path_changed, args=(cron_file,))
+            event.start()
+            event.join()
+            return result
+
+        try:
+            with patch(
+                "picklebot.core.cron_loader.discover_definitions",
+                side_effect=scan_with_event,
+            ):
+                loader.discover_crons()
+
+            assert loader._discovered is None
+        finally:
+            loader.stop_watching()
+
+    def test_paths_outside_crons_dir_are_ignored(self, test_config):
+        """Events outside the crons directory leave the snapshot alone."""
+        create_test_cron(test_config.workspace, cron_id="job-a")
+        loader = CronLoader(test_config)
+        loader.start_watching()
+        try:
+            loader.discover_crons()
+            loader._on_path_changed(str(test_config.workspace / "config.user.yaml"))
+
+            assert loader._discovered is not None
+        finally:
+            loader.stop_watching()
+
+    def test_crons_path_change_restarts_watcher(self, test_config, tmp_path):
+        """Moving crons_path drops the snapshot and watches the new directory."""
+        create_test_cron(test_config.workspace, cron_id="job-a")
+        create_test_cron(tmp_path / "other", cron_id="job-b")
+        loader = CronLoader(test_config)
+        loader.start_watching()
+        try:
+            assert [c.id for c in loader.discover_crons()] == ["job-a"]
+
+            test_config.crons_path = tmp_path / "other" / "crons"
+
+            assert [c.id for c in loader.discover_crons()] == ["job-b"]
+            watched = [e.watch.path for e in loader._observer.emitters]
+            assert watched == [str(test_config.crons_path)]
+        finally:
+            loader.stop_watching()
+
+    def test_read_events_do_not_invalidate(self, test_config):
+        """Open/close-without-write events (e.g. our own reads) keep the snapshot."""
+        create_test_cron(test_config.workspace, cron_id="job-a")
+        loader = CronLoader(test_config)
+        loader._discovered = loader.discover_crons()
+        handler = CronHandler(loader)
+        cron_file = str(test_config.crons_path / "job-a" / "CRON.md")
+
+        handler.on_any_event(FileOpenedEvent(cron_file))
+        handler.on_any_event(FileClosedNoWriteEvent(cron_file))
+        assert loader._discovered is not None
+
+        handler.on_any_event(FileModifiedEvent(cron_file))
+        assert loader._discovered is None
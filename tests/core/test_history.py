@@ -1,152 +1,112 @@
 """Tests for message conversion methods."""
 
 import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
+from pydantic import ValidationError
 
 from picklebot.core.history import HistoryStore, HistoryMessage, HistorySession
 from picklebot.core.events import CronEventSource
 from picklebot.channel.telegram_channel import TelegramEventSource
 from picklebot.core.events import CliEventSource
 
-
-class TestFromMessage:
-    """Tests for HistoryMessage.from_message() class method."""
-
-    def test_from_message_simple_user(self):
-        """Convert simple user message without optional fields."""
-        message = {"role": "user", "content": "Hello, world!"}
-
-        history_msg = HistoryMessage.from_message(message)
-
-        assert history_msg.role == "user"
-        assert history_msg.content == "Hello, world!"
-        assert history_msg.tool_calls is None
-        assert history_msg.tool_call_id is None
-
-    def test_from_message_assistant_with_tool_calls(self):
-        """Convert assistant message with tool calls."""
-        message = {
-            "role": "assistant",
-            "content": "I'll help you with that.",
-            "tool_calls": [
-                {
-                    "id": "call_abc123",
-                    "type": "function",
-                    "function": {
-                        "name": "get_weather",
-                        "arguments": '{"location": "Seattle"}',
-                    },
-                }
-            ],
+_USER_MESSAGE = {"role": "user", "content": "Hello, world!"}
+_ASSISTANT_TOOL_CALL_MESSAGE = {
+    "role": "assistant",
+    "content": "I'll help you with that.",
+    "tool_calls": [
+        {
+            "id": "call_abc123",
+            "type": "function",
+            "function": {
+                "name": "get_weather",
+                "arguments": '{"location": "Seattle"}',
+            },
         }
+    ],
+}
+_TOOL_RESPONSE_MESSAGE = {
+    "role": "tool",
+    "content": "Temperature: 72°F, Sunny",
+    "tool_call_id": "call_abc123",
+}
 
-        history_msg = HistoryMessage.from_message(message)
+_MESSAGE_CASES = [
+    pytest.param(_USER_MESSAGE, id="simple_user"),
+    pytest.param(_ASSISTANT_TOOL_CALL_MESSAGE, id="assistant_with_tool_calls"),
+    pytest.param(_TOOL_RESPONSE_MESSAGE, id="tool_response"),
+]
 
-        assert history_msg.role == "assistant"
-        assert history_msg.content == "I'll help you with that."
-        assert history_msg.tool_calls is not None
-        assert len(history_msg.tool_calls) == 1
-        assert history_msg.tool_calls[0]["id"] == "call_abc123"
-        assert history_msg.tool_calls[0]["function"]["name"] == "get_weather"
-
-    def test_from_message_tool_response(self):
-        """Convert tool response message."""
-        message = {
-            "role": "tool",
-            "content": "Temperature: 72°F, Sunny",
-            "tool_call_id": "call_abc123",
-        }
 
+class TestFromMessage:
+    """Tests for HistoryMessage.from_message() class method."""
+
+    @pytest.mark.parametrize("message", _MESSAGE_CASES)
+    def test_from_message(self, message):
+        """Convert litellm messages, leaving absent optional fields as None."""
         history_msg = HistoryMessage.from_message(message)
 
-        assert history_msg.role == "tool"
-        assert history_msg.content == "Temperature: 72°F, Sunny"
-        assert history_msg.tool_call_id == "call_abc123"
-        assert history_msg.tool_calls is None
+        assert history_msg.role == message["role"]
+        assert history_msg.content == message["content"]
+        assert history_msg.tool_calls == message.get("tool_calls")
+        assert history_msg.tool_call_id == message.get("tool_call_id")
 
 
 class TestToMessage:
     """Tests for HistoryMessage.to_message() instance method."""
 
-    def test_to_message_simple_user(self):
-        """Convert simple user message to Message format."""
-        history_msg = HistoryMessage(role="user", content="Hello!")
-
-        message = history_msg.to_message()
-
-        assert message["role"] == "user"
-        assert message["content"] == "Hello!"
-        assert "tool_calls" not in message
-        assert "tool_call_id" not in message
-
-    def test_to_message_assistant_with_tool_calls(self):
-        """Convert assistant message with tool calls to Message format."""
-        history_msg = HistoryMessage(
-            role="assistant",
-            content="Processing...",
-            tool_calls=[
+    @pytest.mark.parametrize(
+        "history_msg,expected",
+        [
+            pytest.param(
+                HistoryMessage(role="user", content="Hello!"),
+                {"role": "user", "content": "Hello!"},
+                id="simple_user",
+            ),
+            pytest.param(
+                HistoryMessage(
+                    role="assistant",
+                    content="Processing...",
+                    tool_calls=_ASSISTANT_TOOL_CALL_MESSAGE["tool_calls"],
+                ),
                 {
-                    "id": "call_xyz789",
-                    "type": "function",
-                    "function": {"name": "calculate", "arguments": '{"x": 1}'},
-                }
-            ],
-        )
-
-        message = history_msg.to_message()
-
-        assert message["role"] == "assistant"
-        assert message["content"] == "Processing..."
-        assert "tool_calls" in message
-        assert len(message["tool_calls"]) == 1
-
-    def test_to_message_tool_response(self):
-        """Convert tool response to Message format."""
-        history_msg = HistoryMessage(
-            role="tool", content="Result: 42", tool_call_id="call_xyz789"
-        )
-
-        message = history_msg.to_message()
-
-        assert message["role"] == "tool"
-        assert message["content"] == "Result: 42"
-        assert "tool_call_id" in message
-        assert message["tool_call_id"] == "call_xyz789"
+                    "role": "assistant",
+                    "content": "Processing...",
+                    "tool_calls": _ASSISTANT_TOOL_CALL_MESSAGE["tool_calls"],
+                },
+                id="assistant_with_tool_calls",
+            ),
+            pytest.param(
+                HistoryMessage(
+                    role="tool", content="Result: 42", tool_call_id="call_xyz789"
+                ),
+                {
+                    "role": "tool",
+                    "content": "Result: 42",
+                    "tool_call_id": "call_xyz789",
+                },
+                id="tool_response",
+            ),
+        ],
+    )
+    def test_to_message(self, history_msg, expected):
+        """Convert to litellm format with only the keys the role uses."""
+        assert history_msg.to_message() == expected
 
 
 class TestRoundTripConversion:
     """Tests for bidirectional conversion consistency."""
 
-    @pytest.mark.parametrize(
-        "message",
-        [
-            {"role": "user", "content": "Test message"},
-            {
-                "role": "assistant",
-                "content": "Response",
-                "tool_calls": [
-                    {
-                        "id": "call_123",
-                        "type": "function",
-                        "function": {"name": "test", "arguments": "{}"},
-                    }
-                ],
-            },
-            {
-                "role": "tool",
-                "content": "Tool output",
-                "tool_call_id": "call_456",
-            },
-        ],
-    )
+    @pytest.mark.parametrize("message", _MESSAGE_CASES)
     def test_round_trip_conversion(self, message):
         """Verify message survives round-trip conversion."""
         history_msg = HistoryMessage.from_message(message)
-        result = history_msg.to_message()
 
-        for key, value in message.items():
-            assert result[key] == value
+        assert history_msg.to_message() == message
 
 
 class TestHistoryStoreInit:
@@ -258,6 +218,25 @@ class TestSaveMessage:
             sessions[0].title == "This is a long question that should definitely be ..."
         )
 
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            ("Short question", "Short question"),
+            ("x" * 50, "x" * 50),
+            ("x" * 51, "x" * 50 + "..."),
+        ],
+        ids=["short", "exact_limit", "over_limit"],
+    )
+    def test_title_truncation_boundary(self, history_store, content, expected):
+        """Titles are only truncated when the message exceeds the limit."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content=content)
+        )
+
+        assert history_store.list_sessions()[0].title == expected
+
     def test_handles_tool_calls(self, history_store):
         """save_message should store tool_calls."""
         source = CliEventSource()
@@ -275,6 +254,40 @@ class TestSaveMessage:
         assert messages[0].tool_calls[0]["id"] == "call-1"
 
 
+class TestSaveMessages:
+    def test_saves_batch_in_order(self, history_store):
+        """save_messages appends every message and bumps the count once."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+
+        history_store.save_messages(
+            "session-1",
+            [
+                HistoryMessage(role="assistant", content="Calling tools"),
+                HistoryMessage(role="user", content="First question"),
+                HistoryMessage(role="user", content="Second question"),
+            ],
+        )
+
+        messages = history_store.get_messages("session-1")
+        assert [m.content for m in messages] == [
+            "Calling tools",
+            "First question",
+            "Second question",
+        ]
+        session = history_store.get_session_info("session-1")
+        assert session is not None
+        assert session.message_count == 3
+        assert session.title == "First question"
+        assert len(history_store.index_path.read_bytes().splitlines()) == 2
+
+    def test_unknown_session_raises(self, history_store):
+        """save_messages rejects sessions that were never created."""
+        with pytest.raises(ValueError, match="Session not found"):
+            history_store.save_messages(
+                "missing", [HistoryMessage(role="user", content="Hi")]
+            )
+
+
 class TestGetMessages:
     def test_returns_empty_list_for_new_session(self, history_store):
         """get_messages should return empty list for new session."""
@@ -301,6 +314,16 @@ class TestGetMessages:
         assert messages[0].role == "user"
         assert messages[1].role == "assistant"
 
+    def test_round_trips_non_ascii_content(self, history_store):
+        """Messages and titles survive the bytes-level JSONL round trip."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="Café ☕ 你好")
+        )
+
+        assert history_store.get_messages("session-1")[0].content == "Café ☕ 你好"
+        assert history_store.list_sessions()[0].title == "Café ☕ 你好"
+
 
 class TestListSessions:
     def test_returns_empty_list_when_no_sessions(self, history_store):
@@ -323,6 +346,18 @@ class TestListSessions:
         assert sessions[0].id == "session-1"  # Most recently updated
         assert sessions[1].id == "session-2"
 
+    def test_returned_sessions_cannot_corrupt_index(self, history_store):
+        """Sessions handed out from the index are immutable."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+
+        with pytest.raises(ValidationError):
+            history_store.list_sessions()[0].title = "Changed"
+        with pytest.raises(ValidationError):
+            history_store.get_session_info("session-1").message_count = 5
+
+        assert history_store.get_session_info("session-1").title is None
+        assert history_store.get_session_info("session-1").message_count == 0
+
 
 class TestHistoryStoreWithSource:
     """Tests for HistoryStore with source support."""
@@ -420,3 +455,453 @@ class TestHistorySessionWithSource:
         typed_source = restored.get_source()
         assert isinstance(typed_source, TelegramEventSource)
         assert typed_source.user_id == "user_123"
+
+
+class TestSessionFileHandles:
+    """Tests for buffered session file handles."""
+
+    def test_writes_outside_session_are_flushed_before_index(self, history_store):
+        """Without session(), a message is on disk once the index counts it."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="Hello")
+        )
+
+        session_file = history_store.sessions_path / "session-1.jsonl"
+        assert json.loads(session_file.read_text())["content"] == "Hello"
+        reloaded = HistoryStore(history_store.base_path)
+        assert reloaded.get_session_info("session-1").message_count == 1
+
+    def test_writes_inside_session_are_buffered_until_sync(self, history_store):
+        """Messages saved inside session() stay buffered until sync()."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        session_file = history_store.sessions_path / "session-1.jsonl"
+
+        with history_store.session("session-1"):
+            history_store.save_message(
+                "session-1", HistoryMessage(role="user", content="Hello")
+            )
+            assert session_file.read_text() == ""
+
+            history_store.sync()
+
+            assert json.loads(session_file.read_text())["content"] == "Hello"
+
+    def test_nested_session_blocks_flush_on_outermost_exit(self, history_store):
+        """A nested session() for the same id keeps the handle until the outer exit."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        session_file = history_store.sessions_path / "session-1.jsonl"
+
+        with history_store.session("session-1"):
+            with history_store.session("session-1"):
+                history_store.save_message(
+                    "session-1", HistoryMessage(role="user", content="a")
+                )
+            assert session_file.read_bytes() == b""
+
+        assert json.loads(session_file.read_text())["content"] == "a"
+
+    def test_handle_is_reused_across_messages(self, history_store):
+        """Consecutive messages to one session share one open handle."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="a")
+        )
+        handle = history_store._session_files["session-1"]
+
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="b")
+        )
+
+        assert history_store._session_files["session-1"] is handle
+        assert [m.content for m in history_store.get_messages("session-1")] == [
+            "a",
+            "b",
+        ]
+
+    def test_least_recently_used_handle_is_closed(self, history_store, monkeypatch):
+        """Open handles are capped, closing the least recently written session."""
+        monkeypatch.setattr("picklebot.core.history.MAX_OPEN_SESSION_FILES", 2)
+        for sid in ("s1", "s2", "s3"):
+            history_store.create_session("agent", sid, source=CliEventSource())
+            history_store.save_message(sid, HistoryMessage(role="user", content=sid))
+
+        assert list(history_store._session_files) == ["s2", "s3"]
+        # The evicted handle was flushed on close
+        assert history_store.get_messages("s1")[0].content == "s1"
+
+    def test_concurrent_writers_keep_lines_whole(self, history_store, monkeypatch):
+        """Two stores appending to one session never split each other's lines."""
+        monkeypatch.setattr("picklebot.core.history.SESSION_WRITE_BUFFER", 100)
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        other = HistoryStore(history_store.base_path)
+
+        for i in range(10):
+            for store, name in ((history_store, "a"), (other, "b")):
+                store.save_message(
+                    "session-1", HistoryMessage(role="user", content=name * (40 * i))
+                )
+        other.close()
+        history_store.close()
+
+        lines = (history_store.sessions_path / "session-1.jsonl").read_bytes()
+        contents = [json.loads(line)["content"] for line in lines.splitlines()]
+        assert sorted(contents) == sorted(
+            name * (40 * i) for i in range(10) for name in "ab"
+        )
+
+    def test_sync_from_another_thread_keeps_lines_intact(
+        self, history_store, monkeypatch
+    ):
+        """A thread syncing while messages are written neither fails nor duplicates."""
+        monkeypatch.setattr("picklebot.core.history.SESSION_WRITE_BUFFER", 256)
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        stop = threading.Event()
+
+        def sync_until_stopped():
+            while not stop.is_set():
+                history_store.sync("session-1")
+
+        # Switch threads often so writes land while a flush is in progress
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        syncer = threading.Thread(target=sync_until_stopped)
+        syncer.start()
+        try:
+            with history_store.session("session-1"):
+                for i in range(2000):
+                    history_store.save_message(
+                        "session-1", HistoryMessage(role="user", content=str(i))
+                    )
+        finally:
+            stop.set()
+            syncer.join()
+            sys.setswitchinterval(interval)
+
+        lines = (history_store.sessions_path / "session-1.jsonl").read_bytes()
+        contents = [json.loads(line)["content"] for line in lines.splitlines()]
+        assert contents == [str(i) for i in range(2000)]
+
+    def test_session_context_flushes_on_exit(self, history_store):
+        """session() holds the handle for its block and flushes it on exit."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        session_file = history_store.sessions_path / "session-1.jsonl"
+
+        with history_store.session("session-1") as store:
+            handle = store._session_files["session-1"]
+            store.save_message("session-1", HistoryMessage(role="user", content="a"))
+            store.save_message("session-1", HistoryMessage(role="user", content="b"))
+            assert store._session_files["session-1"] is handle
+            assert session_file.read_bytes() == b""
+
+        assert "session-1" not in history_store._session_files
+        assert len(session_file.read_bytes().splitlines()) == 2
+
+    def test_close_flushes_and_releases_handles(self, history_store):
+        """close() writes pending messages and drops every handle."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="Hello")
+        )
+
+        history_store.close()
+
+        assert history_store._session_files == {}
+        session_file = history_store.sessions_path / "session-1.jsonl"
+        assert json.loads(session_file.read_text())["content"] == "Hello"
+
+
+class TestDeleteSession:
+    def test_removes_index_entry_and_file(self, history_store):
+        """delete_session drops the session file and its index entry."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        history_store.create_session("agent", "session-2", source=CliEventSource())
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="Hello")
+        )
+
+        assert history_store.delete_session("session-1") is True
+
+        assert [s.id for s in history_store.list_sessions()] == ["session-2"]
+        assert not (history_store.sessions_path / "session-1.jsonl").exists()
+        assert "session-1" not in history_store._session_files
+
+    def test_missing_session_returns_false(self, history_store):
+        """delete_session reports unknown sessions."""
+        assert history_store.delete_session("nope") is False
+
+
+class TestSessionIndex:
+    """Tests for the in-memory session index backed by index.jsonl."""
+
+    def test_updates_append_and_last_line_wins_on_replay(self, history_store):
+        """Each update appends a line; a fresh store replays to the latest state."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="Hi")
+        )
+        history_store.save_message(
+            "session-1", HistoryMessage(role="assistant", content="Hello")
+        )
+
+        assert len(history_store.index_path.read_bytes().splitlines()) == 3
+
+        reloaded = HistoryStore(history_store.base_path).get_session_info("session-1")
+        assert reloaded is not None
+        assert reloaded.message_count == 2
+        assert reloaded.title == "Hi"
+
+    def test_reads_do_not_reparse_index(self, history_store, monkeypatch):
+        """Once loaded, lookups are served from memory."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        history_store.list_sessions()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("index.jsonl re-parsed")
+
+        monkeypatch.setattr(HistorySession, "model_validate_json", fail)
+
+        assert history_store.get_session_info("session-1") is not None
+        assert [s.id for s in history_store.list_sessions()] == ["session-1"]
+
+    def test_picks_up_writes_from_another_store(self, history_store):
+        """A change to index.jsonl made elsewhere triggers a reload."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        history_store.list_sessions()
+
+        other = HistoryStore(history_store.base_path)
+        other.create_session("agent", "session-2", source=CliEventSource())
+
+        assert {s.id for s in history_store.list_sessions()} == {
+            "session-1",
+            "session-2",
+        }
+
+    def test_compacts_index_when_updates_pile_up(self, history_store, monkeypatch):
+        """index.jsonl is rewritten to one line per session once it grows."""
+        monkeypatch.setattr("picklebot.core.history.INDEX_COMPACT_SLACK", 0)
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        for i in range(5):
+            history_store.save_message(
+                "session-1", HistoryMessage(role="user", content=str(i))
+            )
+
+        assert len(history_store.index_path.read_bytes().splitlines()) <= 2
+        reloaded = HistoryStore(history_store.base_path).get_session_info("session-1")
+        assert reloaded is not None
+        assert reloaded.message_count == 5
+
+    def test_sorted_listing_is_reused_until_index_changes(self, history_store):
+        """list_sessions re-sorts only after the index changes."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        history_store.create_session("agent", "session-2", source=CliEventSource())
+
+        first = history_store.list_sessions()
+        second = history_store.list_sessions()
+        assert first == second
+        assert first is not second  # callers get their own list
+
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="Hi")
+        )
+        assert [s.id for s in history_store.list_sessions()] == [
+            "session-1",
+            "session-2",
+        ]
+
+    def test_updates_patch_sorted_listing_without_resorting(
+        self, history_store, monkeypatch
+    ):
+        """An update moves its session to the front without a full sort."""
+        for sid in ("session-1", "session-2", "session-3"):
+            history_store.create_session("agent", sid, source=CliEventSource())
+        history_store.list_sessions()
+
+        def fail_sorted(*args, **kwargs):
+            raise AssertionError("sessions re-sorted")
+
+        monkeypatch.setattr("picklebot.core.history.sorted", fail_sorted, raising=False)
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="Hi")
+        )
+
+        sessions = history_store.list_sessions()
+        assert [s.id for s in sessions] == ["session-1", "session-3", "session-2"]
+        assert sessions[0].message_count == 1
+
+    def test_index_handle_is_held_across_updates(self, history_store):
+        """index.jsonl is appended through one held handle."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        [handle] = history_store._index_file
+
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="a")
+        )
+
+        assert history_store._index_file == [handle]
+
+    def test_index_handle_reopens_when_file_replaced(self, history_store):
+        """A removed index.jsonl is recreated rather than written to the old inode."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        history_store.index_path.unlink()
+
+        history_store.create_session("agent", "session-2", source=CliEventSource())
+
+        reloaded = HistoryStore(history_store.base_path)
+        assert [s.id for s in reloaded.list_sessions()] == ["session-2"]
+
+    def test_index_handle_reopen_closes_old_handle(self, history_store):
+        """Reopening index.jsonl closes the previous handle instead of keeping it."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        [old_handle] = history_store._index_file
+        history_store.index_path.unlink()
+
+        history_store.create_session("agent", "session-2", source=CliEventSource())
+
+        assert old_handle.closed
+        [new_handle] = history_store._index_file
+        assert new_handle is not old_handle
+
+    def test_close_compacts_index(self, history_store):
+        """close() rewrites index.jsonl down to one line per session."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="a")
+        )
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="b")
+        )
+
+        history_store.close()
+
+        assert len(history_store.index_path.read_bytes().splitlines()) == 1
+        reloaded = HistoryStore(history_store.base_path).get_session_info("session-1")
+        assert reloaded is not None
+        assert reloaded.message_count == 2
+
+    def test_close_leaves_index_written_elsewhere(self, history_store):
+        """close() does not compact over lines another store appended."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="a")
+        )
+        other = HistoryStore(history_store.base_path)
+        other.create_session("agent", "session-2", source=CliEventSource())
+
+        history_store.close()
+
+        reloaded = HistoryStore(history_store.base_path)
+        assert {s.id for s in reloaded.list_sessions()} == {"session-1", "session-2"}
+
+
+class TestGetMessagesCache:
+    """Tests for incremental re-reads in get_messages."""
+
+    def test_only_new_lines_are_parsed(self, history_store, monkeypatch):
+        """Messages parsed by an earlier call are not parsed again."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="a")
+        )
+        history_store.get_messages("session-1")
+
+        parsed: list[bytes] = []
+        validate = HistoryMessage.model_validate_json
+
+        def tracking_validate(data, *args, **kwargs):
+            parsed.append(data)
+            return validate(data, *args, **kwargs)
+
+        monkeypatch.setattr(HistoryMessage, "model_validate_json", tracking_validate)
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="b")
+        )
+
+        messages = history_store.get_messages("session-1")
+
+        assert [m.content for m in messages] == ["a", "b"]
+        assert len(parsed) == 1
+
+    def test_unchanged_file_is_not_reopened(self, history_store, monkeypatch):
+        """get_messages answers from cache when the file has not grown."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="a")
+        )
+        history_store.get_messages("session-1")
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("session file reopened")
+
+        monkeypatch.setattr("builtins.open", fail_open)
+
+        assert [m.content for m in history_store.get_messages("session-1")] == ["a"]
+
+    def test_partial_trailing_line_is_read_later(self, history_store):
+        """An incomplete last line is left for the next call."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        session_file = history_store.sessions_path / "session-1.jsonl"
+        line = HistoryMessage(role="user", content="a").model_dump_json().encode()
+
+        session_file.write_bytes(line[:10])
+        assert history_store.get_messages("session-1") == []
+
+        session_file.write_bytes(line + b"\n")
+        assert [m.content for m in history_store.get_messages("session-1")] == ["a"]
+
+    def test_same_size_rewrite_is_reparsed(self, history_store):
+        """A file rewritten in place at the same size is not served from cache."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="a")
+        )
+        history_store.get_messages("session-1")
+
+        session_file = history_store.sessions_path / "session-1.jsonl"
+        stat = session_file.stat()
+        session_file.write_bytes(session_file.read_bytes().replace(b'"a"', b'"b"'))
+        # Force a distinct mtime in case the filesystem clock is coarse
+        os.utime(session_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert [m.content for m in history_store.get_messages("session-1")] == ["b"]
+
+    def test_replaced_file_is_reparsed(self, history_store):
+        """A deleted and recreated session file is read from the start."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="a")
+        )
+        history_store.get_messages("session-1")
+
+        history_store.delete_session("session-1")
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+        history_store.save_message(
+            "session-1", HistoryMessage(role="user", content="b")
+        )
+
+        assert [m.content for m in history_store.get_messages("session-1")] == ["b"]
+
+    def test_concurrent_readers_do_not_duplicate_messages(self, history_store):
+        """Readers racing over the same new lines leave the cache consistent."""
+        history_store.create_session("agent", "session-1", source=CliEventSource())
+
+        def read(_):
+            return len(history_store.get_messages("session-1"))
+
+        # Switch threads often so readers overlap while parsing the tail
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                for i in range(1, 101):
+                    history_store.save_message(
+                        "session-1", HistoryMessage(role="user", content=str(i))
+                    )
+                    assert list(pool.map(read, range(4))) == [i] * 4
+        finally:
+            sys.setswitchinterval(interval)
+
+        fresh = HistoryStore(history_store.base_path)
+        assert history_store.get_messages("session-1") == fresh.get_messages(
+            "session-1"
+        )
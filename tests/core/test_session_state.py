@@ -87,3 +87,32 @@ class TestSessionStatePersistence:
             assert len(state.messages) == 2
             assert state.messages[0]["content"] == "Hello"
             assert state.messages[1]["content"] == "Hi"
+
+    def test_add_messages_persists_batch(self, tmp_path):
+        """add_messages should extend the in-memory list and persist all messages."""
+        from picklebot.core.history import HistoryStore
+
+        mock_context = MagicMock()
+        mock_context.history_store = HistoryStore(tmp_path)
+        source = TelegramEventSource(user_id="123", chat_id="456")
+        state = SessionState(
+            session_id="test-session-id",
+            agent=MagicMock(),
+            messages=[],
+            source=source,
+            shared_context=mock_context,
+        )
+        mock_context.history_store.create_session(
+            "test-agent", "test-session-id", source
+        )
+
+        state.add_messages(
+            [
+                {"role": "tool", "content": "a", "tool_call_id": "call-1"},
+                {"role": "tool", "content": "b", "tool_call_id": "call-2"},
+            ]
+        )
+
+        assert [m["content"] for m in state.messages] == ["a", "b"]
+        messages = mock_context.history_store.get_messages("test-session-id")
+        assert [m.tool_call_id for m in messages] == ["call-1", "call-2"]
@@ -1,9 +1,13 @@
 """Tests for SkillLoader."""
 
+import os
+from unittest.mock import patch
+
 import pytest
 
 from picklebot.core.skill_loader import SkillDef, SkillLoader
-from picklebot.utils.def_loader import DefNotFoundError
+from picklebot.utils.def_loader import DefNotFoundError, split_definition
+from tests.helpers import create_test_skill
 
 
 class TestSkillLoaderDiscovery:
@@ -11,23 +15,9 @@ class TestSkillLoaderDiscovery:
 
     def test_discover_skills_valid_skill(self, test_config):
         """Test discover_skills finds and parses valid skill with content."""
-        # Create skills directory
-        skills_dir = test_config.skills_path
-        skills_dir.mkdir(parents=True, exist_ok=True)
-
-        skill_dir = skills_dir / "test-skill"
-        skill_dir.mkdir()
-        skill_file = skill_dir / "SKILL.md"
-        skill_file.write_text(
-            """---
-name: Test Skill
-description: A test skill
----
-
-# Test Skill Content
-
-This is the skill content.
-"""
+        create_test_skill(
+            test_config.workspace,
+            content="# Test Skill Content\n\nThis is the skill content.",
         )
 
         loader = SkillLoader(test_config)
@@ -42,29 +32,31 @@ This is the skill content.
         # Verify it's a SkillDef instance
         assert isinstance(result[0], SkillDef)
 
+    def test_skills_path_change_is_not_served_from_cache(self, test_config, tmp_path):
+        """A same-named skill in the new skills_path is read from disk."""
+        old_dir = create_test_skill(test_config.workspace, content="Old.")
+        new_dir = create_test_skill(tmp_path / "other", content="New!")
+        # Same folder name, size and mtime: only the directory differs
+        stat = (old_dir / "SKILL.md").stat()
+        os.utime(new_dir / "SKILL.md", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        loader = SkillLoader(test_config)
+        assert loader.discover_skills()[0].content == "Old."
+
+        test_config.skills_path = tmp_path / "other" / "skills"
+
+        assert loader.discover_skills()[0].content == "New!"
+        assert loader.load_skill("test-skill").content == "New!"
+
 
 class TestSkillLoaderLoad:
     """Tests for SkillLoader.load_skill() method."""
 
     def test_load_skill_returns_full_content(self, test_config):
         """Test load_skill returns SkillDef with full content."""
-        skills_dir = test_config.skills_path
-        skills_dir.mkdir(parents=True, exist_ok=True)
-
-        skill_dir = skills_dir / "test-skill"
-        skill_dir.mkdir()
-        skill_file = skill_dir / "SKILL.md"
-        skill_content = """---
-name: Test Skill
-description: A test skill
----
-
-# Test Skill
-
-This is the skill content.
-More content here.
-"""
-        skill_file.write_text(skill_content)
+        create_test_skill(
+            test_config.workspace,
+            content="# Test Skill\n\nThis is the skill content.\nMore content here.",
+        )
 
         loader = SkillLoader(test_config)
         skill_def = loader.load_skill("test-skill")
@@ -87,6 +79,41 @@ More content here.
 
         assert exc.value.def_id == "nonexistent"
 
+    def test_load_skill_reads_only_requested_skill(self, test_config):
+        """load_skill parses the requested SKILL.md, not every skill."""
+        create_test_skill(test_config.workspace, skill_id="wanted")
+        create_test_skill(test_config.workspace, skill_id="other")
+        loader = SkillLoader(test_config)
+
+        with patch(
+            "picklebot.utils.def_loader.split_definition",
+            wraps=split_definition,
+        ) as mock_split:
+            skill_def = loader.load_skill("wanted")
+
+        assert skill_def.id == "wanted"
+        assert mock_split.call_count == 1
+
+    def test_load_skill_invalid_skill_is_not_found(self, test_config):
+        """A SKILL.md missing required fields is reported as not found."""
+        skill_dir = test_config.skills_path / "broken"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("---\nname: Broken\n---\nBody\n")
+        loader = SkillLoader(test_config)
+
+        with pytest.raises(DefNotFoundError):
+            loader.load_skill("broken")
+
+    @pytest.mark.parametrize("skill_id", [".hidden", "__pycache__", "../test-skill"])
+    def test_load_skill_rejects_non_skill_ids(self, test_config, skill_id):
+        """IDs that discovery would never return are not loadable."""
+        # The folder exists on disk, but is not a loadable skill
+        create_test_skill(test_config.workspace, skill_id=skill_id)
+        loader = SkillLoader(test_config)
+
+        with pytest.raises(DefNotFoundError):
+            loader.load_skill(skill_id)
+
 
 class TestSkillLoaderTemplateSubstitution:
     """Tests for template variable substitution in skill content."""
@@ -104,23 +131,7 @@ class TestSkillLoaderTemplateSubstitution:
     )
     def test_template_substitution(self, test_config, content, expected_check):
         """Skill content should substitute template variables."""
-        from picklebot.core.skill_loader import SkillLoader
-
-        skills_dir = test_config.skills_path
-        skills_dir.mkdir(parents=True, exist_ok=True)
-
-        skill_dir = skills_dir / "test-skill"
-        skill_dir.mkdir()
-        skill_file = skill_dir / "SKILL.md"
-        skill_file.write_text(
-            f"""---
-name: Test Skill
-description: A test skill
----
-
-{content}
-"""
-        )
+        create_test_skill(test_config.workspace, content=content)
 
         loader = SkillLoader(test_config)
         skill_def = loader.load_skill("test-skill")
@@ -1,4 +1,6 @@
 # tests/events/test_bus.py
+import asyncio
+
 import pytest
 from picklebot.core.events import Event, OutboundEvent, InboundEvent, AgentEventSource
 from picklebot.channel.telegram_channel import TelegramEventSource
@@ -113,3 +115,51 @@ async def test_subscribe_to_multiple_types(event_bus):
 
     assert len(received_outbound) == 1
     assert len(received_inbound) == 1
+
+
+async def test_publish_enqueues_without_dispatching(event_bus):
+    event = InboundEvent(
+        session_id="test-session",
+        content="Hello",
+        source=TelegramEventSource(user_id="123", chat_id="456"),
+        timestamp=12345.0,
+    )
+
+    await event_bus.publish(event)
+
+    assert event_bus._queue.qsize() == 1
+    assert event_bus._queue.get_nowait() is event
+
+
+async def test_single_subscriber_error_is_contained(event_bus):
+    async def failing_handler(event: Event):
+        raise RuntimeError("boom")
+
+    event_bus.subscribe(OutboundEvent, failing_handler)
+
+    event = OutboundEvent(
+        session_id="test-session",
+        content="Hello",
+        source=AgentEventSource(agent_id="pickle"),
+        timestamp=12345.0,
+    )
+
+    # Should log, not raise
+    await event_bus._notify_subscribers(event)
+
+
+async def test_single_subscriber_cancellation_is_contained(event_bus):
+    async def cancelling_handler(event: Event):
+        raise asyncio.CancelledError
+
+    event_bus.subscribe(OutboundEvent, cancelling_handler)
+
+    event = OutboundEvent(
+        session_id="test-session",
+        content="Hello",
+        source=AgentEventSource(agent_id="pickle"),
+        timestamp=12345.0,
+    )
+
+    # A handler's own cancellation must not stop the bus
+    await event_bus._notify_subscribers(event)
@@ -117,8 +117,8 @@ async def test_publish_outbound_persists_and_notifies(event_bus, events_dir):
         )
         await event_bus.publish(event)
 
-        # Allow async tasks to complete
-        await asyncio.sleep(0.1)
+        # Wait until the worker has dispatched everything queued
+        await asyncio.wait_for(event_bus._queue.join(), timeout=5)
 
         # Should have persisted
         pending_files = list((events_dir / "pending").glob("*.json"))
@@ -154,7 +154,8 @@ async def test_publish_inbound_no_persist_inbound(event_bus, events_dir):
         )
         await event_bus.publish(event)
 
-        await asyncio.sleep(0.1)
+        # Wait until the worker has dispatched everything queued
+        await asyncio.wait_for(event_bus._queue.join(), timeout=5)
 
         # Should NOT have persisted
         pending_files = list((events_dir / "pending").glob("*.json"))
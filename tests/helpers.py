@@ -82,6 +82,18 @@ def create_test_skill(
     return skill_dir
 
 
+_CRON_MD_TEMPLATE = (
+    "---\n"
+    "name: {name}\n"
+    "description: {description}\n"
+    "agent: {agent}\n"
+    'schedule: "{schedule}"\n'
+    "{extra}"
+    "---\n"
+    "{prompt}\n"
+)
+
+
 def create_test_cron(
     workspace: Path,
     cron_id: str = "test-cron",
@@ -90,7 +102,7 @@ def create_test_cron(
     agent: str = "pickle",
     schedule: str = "0 * * * *",
     prompt: str = "Check for updates.",
-    one_off: bool = False,
+    one_off: bool | None = None,
 ) -> Path:
     """Create a minimal test cron in workspace.
 
@@ -102,20 +114,24 @@ def create_test_cron(
         agent: Agent to run
         schedule: Cron schedule expression
         prompt: Cron prompt
-        one_off: Whether this is a one-off cron
+        one_off: Whether this is a one-off cron (omitted from CRON.md if None)
 
     Returns:
         Path to the cron directory
     """
-    crons_dir = workspace / "crons"
-    crons_dir.mkdir(parents=True, exist_ok=True)
-
-    cron_dir = crons_dir / cron_id
+    cron_dir = workspace / "crons" / cron_id
     cron_dir.mkdir(parents=True, exist_ok=True)
 
-    cron_md = cron_dir / "CRON.md"
-    cron_md.write_text(
-        f'---\nname: {name}\ndescription: {description}\nagent: {agent}\nschedule: "{schedule}"\none_off: {one_off}\n---\n{prompt}\n'
+    extra = f"one_off: {one_off}\n" if one_off is not None else ""
+    (cron_dir / "CRON.md").write_text(
+        _CRON_MD_TEMPLATE.format(
+            name=name,
+            description=description,
+            agent=agent,
+            schedule=schedule,
+            extra=extra,
+            prompt=prompt,
+        )
     )
 
     return cron_dir
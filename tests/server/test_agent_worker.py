@@ -66,7 +66,7 @@ async def test_agent_worker_processes_event(test_context, tmp_path):
     event = make_inbound_event(content="Say hello")
     await router.dispatch_event(event)
 
-    await asyncio.sleep(0.5)
+    await asyncio.sleep(0)  # let any spawned executor task start
 
 
 async def test_agent_router_publishes_error_for_nonexistent_agent(test_context):
@@ -276,7 +276,7 @@ async def test_agent_router_concurrent_agents_dont_block(test_context, tmp_path)
     await router.dispatch_event(event_b)
 
     # Both should be able to run concurrently (different agents)
-    await asyncio.sleep(0.5)
+    await asyncio.sleep(0)  # let any spawned executor task start
 
 
 async def test_semaphore_cleanup_removes_unused_semaphores(test_context, tmp_path):
@@ -12,6 +12,7 @@ from picklebot.channel.telegram_channel import TelegramEventSource
 from picklebot.channel.discord_channel import DiscordEventSource
 from picklebot.core.events import CliEventSource
 from picklebot.utils.config import SourceSessionConfig
+from tests.helpers import create_test_agent
 
 
 class FakeChannel:
@@ -84,22 +85,7 @@ class BlockingChannel(FakeChannel):
 
 async def test_channel_worker_publishes_inbound_event(test_context, tmp_path):
     """ChannelWorker publishes INBOUND events to EventBus."""
-    # Create test agent
-    agents_dir = tmp_path / "agents"
-    agents_dir.mkdir(parents=True)
-    test_agent_dir = agents_dir / "test"
-    test_agent_dir.mkdir(parents=True)
-
-    agent_md = test_agent_dir / "AGENT.md"
-    agent_md.write_text(
-        """---
-name: Test Agent
-description: A test agent
----
-
-You are a test assistant.
-"""
-    )
+    create_test_agent(tmp_path, agent_id="test")
 
     channel = FakeCliChannel()
     published_events: list[InboundEvent] = []
@@ -121,16 +107,9 @@ You are a test assistant.
     eventbus_task = test_context.eventbus.start()
 
     try:
-        # Start worker (it will process one message and wait)
-        task = asyncio.create_task(worker.run())
-
-        # Wait for message to be dispatched
-        await asyncio.sleep(0.1)
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
+        # Fake channels dispatch one message and return, so run() completes
+        await worker.run()
+        await asyncio.wait_for(test_context.eventbus._queue.join(), timeout=5)
 
         # Verify event was published
         assert len(published_events) == 1
@@ -149,22 +128,7 @@ You are a test assistant.
 
 async def test_channel_worker_ignores_non_whitelisted(test_context, tmp_path):
     """ChannelWorker ignores messages from non-whitelisted senders."""
-    # Create test agent
-    agents_dir = tmp_path / "agents"
-    agents_dir.mkdir(parents=True)
-    test_agent_dir = agents_dir / "test"
-    test_agent_dir.mkdir(parents=True)
-
-    agent_md = test_agent_dir / "AGENT.md"
-    agent_md.write_text(
-        """---
-name: Test Agent
-description: A test agent
----
-
-You are a test assistant.
-"""
-    )
+    create_test_agent(tmp_path, agent_id="test")
 
     channel = BlockingChannel()
     published_events: list[InboundEvent] = []
@@ -176,36 +140,16 @@ You are a test assistant.
         worker = ChannelWorker(test_context)
         test_context.eventbus.subscribe(InboundEvent, capture_event)
 
-    task = asyncio.create_task(worker.run())
-    await asyncio.sleep(0.1)
-    task.cancel()
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
+    await worker.run()
 
     # No event should have been published - message was blocked
+    assert test_context.eventbus._queue.empty()
     assert len(published_events) == 0
 
 
 async def test_channel_worker_creates_per_user_session(test_context, tmp_path):
     """ChannelWorker creates a new session for each user."""
-    # Create test agent
-    agents_dir = tmp_path / "agents"
-    agents_dir.mkdir(parents=True)
-    test_agent_dir = agents_dir / "test"
-    test_agent_dir.mkdir(parents=True)
-
-    agent_md = test_agent_dir / "AGENT.md"
-    agent_md.write_text(
-        """---
-name: Test Agent
-description: A test agent
----
-
-You are a test assistant.
-"""
-    )
+    create_test_agent(tmp_path, agent_id="test")
 
     channel = FakeCliChannel()
     with patch.object(test_context, "channels", [channel]):
@@ -222,22 +166,7 @@ You are a test assistant.
 
 async def test_channel_worker_reuses_existing_session(test_context, tmp_path):
     """ChannelWorker reuses session from source cache for returning users."""
-    # Create test agent
-    agents_dir = tmp_path / "agents"
-    agents_dir.mkdir(parents=True)
-    test_agent_dir = agents_dir / "test"
-    test_agent_dir.mkdir(parents=True)
-
-    agent_md = test_agent_dir / "AGENT.md"
-    agent_md.write_text(
-        """---
-name: Test Agent
-description: A test agent
----
-
-You are a test assistant.
-"""
-    )
+    create_test_agent(tmp_path, agent_id="test")
 
     # Pre-configure a session in source cache
     test_context.config.sources = {
@@ -262,16 +191,9 @@ You are a test assistant.
     eventbus_task = test_context.eventbus.start()
 
     try:
-        # Start worker
-        task = asyncio.create_task(worker.run())
-
-        # Wait for message to be dispatched
-        await asyncio.sleep(0.1)
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
+        # Fake channels dispatch one message and return, so run() completes
+        await worker.run()
+        await asyncio.wait_for(test_context.eventbus._queue.join(), timeout=5)
 
         # Verify event has the existing session_id
         assert len(published_events) == 1
@@ -287,22 +209,7 @@ You are a test assistant.
 
 async def test_channel_worker_includes_metadata(test_context, tmp_path):
     """ChannelWorker includes platform-specific metadata in events."""
-    # Create test agent
-    agents_dir = tmp_path / "agents"
-    agents_dir.mkdir(parents=True)
-    test_agent_dir = agents_dir / "test"
-    test_agent_dir.mkdir(parents=True)
-
-    agent_md = test_agent_dir / "AGENT.md"
-    agent_md.write_text(
-        """---
-name: Test Agent
-description: A test agent
----
-
-You are a test assistant.
-"""
-    )
+    create_test_agent(tmp_path, agent_id="test")
 
     channel = FakeDiscordChannel()
     published_events: list[InboundEvent] = []
@@ -323,14 +230,9 @@ You are a test assistant.
     eventbus_task = test_context.eventbus.start()
 
     try:
-        # Start worker
-        task = asyncio.create_task(worker.run())
-        await asyncio.sleep(0.1)
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
+        # Fake channels dispatch one message and return, so run() completes
+        await worker.run()
+        await asyncio.wait_for(test_context.eventbus._queue.join(), timeout=5)
 
         # Verify event has Discord metadata (channel_id, not chat_id)
         assert len(published_events) == 1
@@ -509,23 +411,7 @@ class TestDefaultDeliverySource:
 
 async def test_channel_worker_uses_routing_table(test_context, tmp_path):
     """ChannelWorker uses routing table to resolve agents."""
-    # Create test agents
-    agents_dir = tmp_path / "agents"
-    agents_dir.mkdir(parents=True)
-
-    # Create test agent
-    test_agent_dir = agents_dir / "test"
-    test_agent_dir.mkdir(parents=True)
-    agent_md = test_agent_dir / "AGENT.md"
-    agent_md.write_text(
-        """---
-name: Test Agent
-description: A test agent
----
-
-You are a test assistant.
-"""
-    )
+    create_test_agent(tmp_path, agent_id="test")
 
     channel = FakeCliChannel()
     with patch.object(test_context, "channels", [channel]):
@@ -546,22 +432,7 @@ You are a test assistant.
 
 async def test_channel_worker_event_has_timestamp(test_context, tmp_path):
     """ChannelWorker events include timestamp."""
-    # Create test agent
-    agents_dir = tmp_path / "agents"
-    agents_dir.mkdir(parents=True)
-    test_agent_dir = agents_dir / "test"
-    test_agent_dir.mkdir(parents=True)
-
-    agent_md = test_agent_dir / "AGENT.md"
-    agent_md.write_text(
-        """---
-name: Test Agent
-description: A test agent
----
-
-You are a test assistant.
-"""
-    )
+    create_test_agent(tmp_path, agent_id="test")
 
     channel = FakeCliChannel()
     published_events: list[InboundEvent] = []
@@ -582,14 +453,9 @@ You are a test assistant.
     eventbus_task = test_context.eventbus.start()
 
     try:
-        # Start worker
-        task = asyncio.create_task(worker.run())
-        await asyncio.sleep(0.1)
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
+        # Fake channels dispatch one message and return, so run() completes
+        await worker.run()
+        await asyncio.wait_for(test_context.eventbus._queue.join(), timeout=5)
 
         # Verify event has timestamp
         assert len(published_events) == 1
@@ -700,22 +566,7 @@ async def test_callback_creates_inbound_event_without_agent_id(test_context, tmp
     from picklebot.core.events import InboundEvent, CliEventSource
     from unittest.mock import patch, Mock
 
-    # Create test agent
-    agents_dir = tmp_path / "agents"
-    agents_dir.mkdir(parents=True)
-    test_agent_dir = agents_dir / "test"
-    test_agent_dir.mkdir(parents=True)
-
-    agent_md = test_agent_dir / "AGENT.md"
-    agent_md.write_text(
-        """---
-name: Test Agent
-description: A test agent
----
-
-You are a test assistant.
-"""
-    )
+    create_test_agent(tmp_path, agent_id="test")
 
     # Create a fake CLI channel
     channel = FakeCliChannel()
@@ -746,7 +597,7 @@ You are a test assistant.
         await callback("test message", source)
 
         # Wait for event to be processed
-        await asyncio.sleep(0.1)
+        await asyncio.wait_for(test_context.eventbus._queue.join(), timeout=5)
 
         # Verify event was published
         assert len(published_events) == 1
@@ -8,6 +8,7 @@ from unittest.mock import patch
 from picklebot.server.cron_worker import CronWorker, find_due_jobs
 from picklebot.core.cron_loader import CronDef
 from picklebot.core.events import DispatchEvent
+from tests.helpers import create_test_cron
 
 
 def test_find_due_jobs_returns_matching():
@@ -106,17 +107,8 @@ async def test_cron_worker_dispatches_due_job(test_context, test_agent_def):
             pass
 
 
-@pytest.mark.parametrize(
-    "one_off,should_delete",
-    [
-        (True, True),
-        (False, False),
-    ],
-)
-async def test_one_off_cron_deletion(
-    test_context, test_agent_def, one_off, should_delete
-):
-    """CronWorker deletes one-off crons but keeps recurring crons."""
+async def test_tick_deletes_one_off_cron(test_context, test_agent_def):
+    """CronWorker._tick finalizes one-off crons after dispatching."""
     worker = CronWorker(test_context)
 
     mock_cron = CronDef(
@@ -126,7 +118,7 @@ async def test_one_off_cron_deletion(
         agent="test-agent",
         schedule="*/5 * * * *",
         prompt="Test task",
-        one_off=one_off,
+        one_off=True,
     )
 
     with patch.object(
@@ -141,9 +133,25 @@ async def test_one_off_cron_deletion(
                 with patch("picklebot.server.cron_worker.shutil.rmtree") as mock_rmtree:
                     await worker._tick()
 
-    # Verify deletion behavior
     expected_path = test_context.cron_loader.config.crons_path / "test-cron"
-    if should_delete:
-        mock_rmtree.assert_called_once_with(expected_path)
-    else:
-        mock_rmtree.assert_not_called()
+    mock_rmtree.assert_called_once_with(expected_path)
+
+
+@pytest.mark.parametrize(
+    "one_off,should_delete",
+    [
+        (True, True),
+        (False, False),
+    ],
+)
+def test_finalize_one_off(test_context, one_off, should_delete):
+    """_finalize_one_off deletes one-off crons but keeps recurring crons."""
+    worker = CronWorker(test_context)
+    cron_dir = create_test_cron(
+        test_context.config.workspace, cron_id="test-cron", one_off=one_off
+    )
+    cron_def = test_context.cron_loader.load("test-cron")
+
+    worker._finalize_one_off(cron_def)
+
+    assert cron_dir.exists() != should_delete
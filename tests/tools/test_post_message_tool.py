@@ -1,45 +1,16 @@
 """Tests for post_message tool factory."""
 
 from unittest.mock import AsyncMock, MagicMock
-from pathlib import Path
 
 from picklebot.tools.post_message_tool import create_post_message_tool
 from picklebot.utils.config import Config, ChannelConfig, TelegramConfig
 from picklebot.core.events import OutboundEvent
 
 
-def _make_context_with_channels(enabled: bool = True):
-    """Helper to create a mock context with channels config."""
+def _make_context_with_channels(config: Config, enabled: bool = True):
+    """Helper to create a context with channels config."""
     from picklebot.core.context import SharedContext
 
-    # Create minimal config
-    tmp_path = Path("/tmp/test-picklebot")
-    tmp_path.mkdir(exist_ok=True)
-    (tmp_path / "config.user.yaml").write_text(
-        """
-llm:
-  provider: openai
-  model: gpt-4
-  api_key: test-key
-default_agent: test-agent
-"""
-    )
-
-    # Create test agent
-    agents_path = tmp_path / "agents"
-    test_agent_dir = agents_path / "test-agent"
-    test_agent_dir.mkdir(parents=True, exist_ok=True)
-    (test_agent_dir / "AGENT.md").write_text(
-        """---
-name: Test Agent
-description: A test agent
----
-You are a test assistant.
-"""
-    )
-
-    config = Config.load(tmp_path)
-
     # Override channels config
     if enabled:
         config.channels = ChannelConfig(
@@ -68,15 +39,15 @@ def _make_mock_session(
 class TestCreatePostMessageTool:
     """Tests for create_post_message_tool factory function."""
 
-    def test_returns_none_when_channels_disabled(self):
+    def test_returns_none_when_channels_disabled(self, test_config):
         """Should return None when channels is not enabled."""
-        context = _make_context_with_channels(enabled=False)
+        context = _make_context_with_channels(test_config, enabled=False)
         tool = create_post_message_tool(context)
         assert tool is None
 
-    def test_creates_tool_with_correct_schema(self):
+    def test_creates_tool_with_correct_schema(self, test_config):
         """Should return a tool with correct name and parameters when channels is enabled."""
-        context = _make_context_with_channels(enabled=True)
+        context = _make_context_with_channels(test_config, enabled=True)
         tool = create_post_message_tool(context)
 
         assert tool is not None
@@ -89,9 +60,9 @@ class TestCreatePostMessageTool:
 class TestPostMessageToolExecution:
     """Tests for post_message tool execution."""
 
-    async def test_uses_session_for_event(self):
+    async def test_uses_session_for_event(self, test_config):
         """Should use session info for session_id and source."""
-        context = _make_context_with_channels(enabled=True)
+        context = _make_context_with_channels(test_config, enabled=True)
 
         # Mock the eventbus.publish method
         original_publish = context.eventbus.publish
@@ -122,9 +93,9 @@ class TestPostMessageToolExecution:
         # Restore
         context.eventbus.publish = original_publish
 
-    async def test_returns_error_on_exception(self):
+    async def test_returns_error_on_exception(self, test_config):
         """Should return error message if publishing fails."""
-        context = _make_context_with_channels(enabled=True)
+        context = _make_context_with_channels(test_config, enabled=True)
 
         # Mock the eventbus.publish to raise an exception
         original_publish = context.eventbus.publish
@@ -1,16 +1,20 @@
 """Tests for definition loader utilities."""
 
 import logging
-import tempfile
-from pathlib import Path
+import os
+from unittest.mock import patch
 
 import pytest
+import yaml
 
 from picklebot.utils.def_loader import (
+    DefCache,
     DefNotFoundError,
     InvalidDefError,
+    _read_text,
     discover_definitions,
     parse_definition,
+    read_definition,
     substitute_template,
 )
 
@@ -179,6 +183,86 @@ class TestParseDefinition:
         assert result.value == 42
         assert result.content == "Body"
 
+    def test_frontmatter_parses_via_json_when_json_compatible(self):
+        """JSON-compatible frontmatter skips the YAML parser."""
+        content = '---\n{"name": "Test", "value": 42}\n---\nBody'
+
+        with patch("picklebot.utils.def_loader.yaml.load") as mock_yaml:
+            frontmatter, body = parse_definition(
+                content, "test-id", lambda def_id, fm, body: (fm, body)
+            )
+
+        mock_yaml.assert_not_called()
+        assert frontmatter == {"name": "Test", "value": 42}
+        assert body == "Body"
+
+    def test_flat_frontmatter_skips_yaml(self):
+        """Flat key/scalar frontmatter is parsed without PyYAML."""
+        content = (
+            "---\nname: Test Cron\nschedule: '*/5 * * * *'\n"
+            'agent: "pickle"\none_off: true\nmax_concurrency: 2\n---\nBody'
+        )
+
+        with patch("picklebot.utils.def_loader.yaml.load") as mock_yaml:
+            frontmatter, _ = parse_definition(
+                content, "test-id", lambda def_id, fm, body: (fm, body)
+            )
+
+        mock_yaml.assert_not_called()
+        assert frontmatter == {
+            "name": "Test Cron",
+            "schedule": "*/5 * * * *",
+            "agent": "pickle",
+            "one_off": True,
+            "max_concurrency": 2,
+        }
+
+    @pytest.mark.parametrize(
+        "frontmatter_text",
+        [
+            "enabled: yes",
+            "version: 1.0",
+            "name: Test # comment",
+            "url: http://example.com",
+            "quote: 'it''s'",
+            "llm:\n  temperature: 0.7",
+            "tags:\n  - a\n  - b",
+            "on: value",
+        ],
+    )
+    def test_ambiguous_frontmatter_matches_yaml(self, frontmatter_text):
+        """Frontmatter the fast path can't handle is still parsed as YAML."""
+        content = f"---\n{frontmatter_text}\n---\nBody"
+        frontmatter, _ = parse_definition(
+            content, "test-id", lambda def_id, fm, body: (fm, body)
+        )
+
+        assert frontmatter == yaml.safe_load(frontmatter_text)
+
+    def test_yaml_fallback_uses_c_loader_when_available(self):
+        """The YAML fallback prefers libyaml's CSafeLoader."""
+        content = "---\nllm:\n  temperature: 0.7\n---\nBody"
+
+        with patch(
+            "picklebot.utils.def_loader.yaml.load", wraps=yaml.load
+        ) as mock_yaml:
+            frontmatter, _ = parse_definition(
+                content, "test-id", lambda def_id, fm, body: (fm, body)
+            )
+
+        assert frontmatter == {"llm": {"temperature": 0.7}}
+        expected = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        assert mock_yaml.call_args.kwargs["Loader"] is expected
+
+    def test_yaml_flow_mapping_falls_back_to_yaml(self):
+        """Flow mappings that aren't valid JSON are still parsed as YAML."""
+        content = "---\n{name: Test, value: 42}\n---\nBody"
+        frontmatter, _ = parse_definition(
+            content, "test-id", lambda def_id, fm, body: (fm, body)
+        )
+
+        assert frontmatter == {"name": "Test", "value": 42}
+
 
 class TestDefNotFoundError:
     def test_error_message_format(self):
@@ -207,11 +291,129 @@ class TestInvalidDefError:
         assert error.reason == "missing required field: name"
 
 
+class TestDefCache:
+    def test_reads_file_once_then_serves_cache(self, tmp_path):
+        """A definition file is read once; unchanged files come from cache."""
+        def_file = tmp_path / "TEST.md"
+        def_file.write_text("---\nname: Test\n---\nBody")
+        cache = DefCache()
+
+        with patch(
+            "picklebot.utils.def_loader._read_text", wraps=_read_text
+        ) as mock_read:
+            first = cache.read(def_file)
+            second = cache.read(def_file)
+
+        assert mock_read.call_count == 1
+        assert first == second == ({"name": "Test"}, "Body")
+
+    def test_modified_file_is_read_again(self, tmp_path):
+        """A new (mtime, size) signature invalidates the cached split."""
+        def_file = tmp_path / "TEST.md"
+        def_file.write_text("---\nname: Old\n---\nBody")
+        cache = DefCache()
+        cache.read(def_file)
+
+        def_file.write_text("---\nname: New\n---\nBody")
+        stat = def_file.stat()
+        # Same size, so force a distinct mtime in case the clock is coarse
+        os.utime(def_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert cache.read(def_file) == ({"name": "New"}, "Body")
+
+    def test_same_id_in_another_directory_is_read(self, tmp_path):
+        """Entries are keyed by file path, so a moved directory is not served stale."""
+        old_file = tmp_path / "old" / "test" / "TEST.md"
+        new_file = tmp_path / "new" / "test" / "TEST.md"
+        for def_file, name in ((old_file, "Old"), (new_file, "New")):
+            def_file.parent.mkdir(parents=True)
+            def_file.write_text(f"---\nname: {name}\n---\nBody")
+        # Same size and mtime: only the path differs
+        stat = old_file.stat()
+        os.utime(new_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        cache = DefCache()
+        cache.read(old_file)
+
+        assert cache.read(new_file) == ({"name": "New"}, "Body")
+
+    def test_get_returns_only_fresh_entries(self, tmp_path):
+        """get() never reads the file; it only reports a still-valid split."""
+        def_file = tmp_path / "TEST.md"
+        def_file.write_text("---\nname: Test\n---\nBody")
+        cache = DefCache()
+        assert cache.get(def_file) is None
+
+        cache.read(def_file)
+
+        assert cache.get(def_file) == ({"name": "Test"}, "Body")
+
+    def test_invalidate_one_definition(self, tmp_path):
+        """invalidate(def_file) forces only that file to be read again."""
+        (tmp_path / "A.md").write_text("A")
+        (tmp_path / "B.md").write_text("B")
+        cache = DefCache()
+        cache.read(tmp_path / "A.md")
+        cache.read(tmp_path / "B.md")
+
+        cache.invalidate(tmp_path / "A.md")
+        with patch(
+            "picklebot.utils.def_loader._read_text", wraps=_read_text
+        ) as mock_read:
+            cache.read(tmp_path / "A.md")
+            cache.read(tmp_path / "B.md")
+
+        mock_read.assert_called_once_with(tmp_path / "A.md")
+
+    def test_invalidate_all_definitions(self, tmp_path):
+        """invalidate() with no ID drops every cached definition."""
+        (tmp_path / "A.md").write_text("A")
+        (tmp_path / "B.md").write_text("B")
+        cache = DefCache()
+        cache.read(tmp_path / "A.md")
+        cache.read(tmp_path / "B.md")
+
+        cache.invalidate()
+        with patch(
+            "picklebot.utils.def_loader._read_text", wraps=_read_text
+        ) as mock_read:
+            cache.read(tmp_path / "A.md")
+            cache.read(tmp_path / "B.md")
+
+        assert mock_read.call_count == 2
+
+
+class TestReadDefinition:
+    def test_parses_on_every_read(self, tmp_path):
+        """The split is cached, but parse_fn runs on every read."""
+        def_file = tmp_path / "TEST.md"
+        def_file.write_text("---\nname: Test\n---\nBody")
+        cache = DefCache()
+        calls = []
+
+        def parse(def_id, fm, body):
+            calls.append(def_id)
+            return (fm, body)
+
+        first = read_definition(def_file, "test", parse, cache)
+        second = read_definition(def_file, "test", parse, cache)
+
+        assert calls == ["test", "test"]
+        assert first == second == ({"name": "Test"}, "Body")
+
+    def test_missing_file_raises(self, tmp_path):
+        """Missing files raise FileNotFoundError with or without a cache."""
+        with pytest.raises(FileNotFoundError):
+            read_definition(tmp_path / "missing.md", "x", lambda *args: args)
+        with pytest.raises(FileNotFoundError):
+            read_definition(
+                tmp_path / "missing.md", "x", lambda *args: args, DefCache()
+            )
+
+
 class TestDiscoverDefinitions:
     @pytest.fixture
-    def temp_dir(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
+    def temp_dir(self, tmp_path):
+        return tmp_path
 
     @pytest.fixture
     def logger(self):
@@ -307,3 +509,66 @@ class TestDiscoverDefinitions:
 
         assert len(results) == 1
         assert results[0]["id"] == "skill1"
+
+    def test_discovers_many_definitions_in_parallel(self, temp_dir):
+        """Large directories are read on a thread pool with the same results."""
+        for i in range(20):
+            def_dir = temp_dir / f"def-{i:02d}"
+            def_dir.mkdir()
+            (def_dir / "TEST.md").write_text(f"---\nname: Def {i}\n---\nBody {i}")
+        (temp_dir / "no-file").mkdir()
+
+        results = discover_definitions(
+            temp_dir, "TEST.md", lambda def_id, fm, body: (def_id, fm["name"], body)
+        )
+
+        assert sorted(results) == [
+            (f"def-{i:02d}", f"Def {i}", f"Body {i}") for i in range(20)
+        ]
+
+    def test_cached_discovery_skips_thread_pool(self, temp_dir):
+        """Unchanged files come from the cache without spinning up a pool."""
+        for i in range(20):
+            def_dir = temp_dir / f"def-{i:02d}"
+            def_dir.mkdir()
+            (def_dir / "TEST.md").write_text(f"---\nname: Def {i}\n---\nBody {i}")
+        cache = DefCache()
+
+        def parse(def_id, fm, body):
+            return def_id
+
+        first = discover_definitions(temp_dir, "TEST.md", parse, cache)
+        with patch("picklebot.utils.def_loader.ThreadPoolExecutor") as mock_pool:
+            second = discover_definitions(temp_dir, "TEST.md", parse, cache)
+
+        mock_pool.assert_not_called()
+        assert sorted(first) == sorted(second)
+
+    def test_skips_hidden_and_ignored_directories(self, temp_dir, caplog):
+        """Dot-folders and ignored names are skipped without a warning."""
+        for name in (".git", "__pycache__", "skill1"):
+            (temp_dir / name).mkdir()
+        (temp_dir / "skill1" / "SKILL.md").write_text("---\nname: One\n---\nBody")
+
+        with caplog.at_level(logging.WARNING):
+            results = discover_definitions(
+                temp_dir, "SKILL.md", lambda def_id, fm, body: def_id
+            )
+
+        assert results == ["skill1"]
+        assert caplog.records == []
+
+    def test_custom_ignored_names(self, temp_dir):
+        """Custom ignored names are skipped on top of DEFAULT_IGNORED_NAMES."""
+        for name in ("skill1", "drafts", "__pycache__"):
+            (temp_dir / name).mkdir()
+            (temp_dir / name / "SKILL.md").write_text("---\nname: X\n---\nBody")
+
+        results = discover_definitions(
+            temp_dir,
+            "SKILL.md",
+            lambda def_id, fm, body: def_id,
+            ignored_names={"drafts"},
+        )
+
+        assert results == ["skill1"]